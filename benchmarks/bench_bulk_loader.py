@@ -0,0 +1,44 @@
+import argparse
+import time
+
+from benchmarks.synthetic import make_computer_dataframe, make_scratch_table_class
+from databases.asset_database import AssetDatabase
+from databases.models import Computer
+from utils.config import config
+
+
+def timed(label, function, *args, **kwargs):
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    print(f'{label}: {time.perf_counter() - start:.2f}s')
+
+
+def load(asset_db, table_class, dataframe, ignore_fields, bulk_load):
+    config.BULK_LOAD_TABLES = [table_class.__tablename__] if bulk_load else []
+    asset_db.update_or_insert_data(table_class, dataframe, ignore_fields=ignore_fields)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare INSERT ... VALUES and COPY based upserts')
+    parser.add_argument('--rows', type=int, default=500000)
+    args = parser.parse_args()
+
+    asset_db = AssetDatabase()
+    table_class = make_scratch_table_class(Computer, 'bench_cmdb_ci_computer')
+    dataframe = make_computer_dataframe(args.rows)
+    dataframe = dataframe.astype(object).where(dataframe.notna(), None)
+    bulk_load_tables = config.BULK_LOAD_TABLES
+    try:
+        for label, bulk_load in [('values', False), ('copy', True)]:
+            table_class.__table__.drop(asset_db.engine, checkfirst=True)
+            table_class.__table__.create(asset_db.engine)
+            for phase in ['insert', 'update']:
+                timed(f'{label} {phase} {args.rows} rows', load, asset_db, table_class, dataframe.copy(),
+                      ['updated_time'], bulk_load)
+    finally:
+        config.BULK_LOAD_TABLES = bulk_load_tables
+        table_class.__table__.drop(asset_db.engine, checkfirst=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.synthetic import make_temp_employee_directory
+from generate_employee_report import EMAIL_COLUMNS, add_email_columns, build_email_lookup
+
+
+def legacy_enrichment(temp_employee_manager, employee_id_email):
+    for id_column, email_column in EMAIL_COLUMNS.items():
+        columns_to_rename = {'employee_id': id_column, 'employee_email': email_column}
+        temp_employee_manager = temp_employee_manager.merge(employee_id_email.rename(columns=columns_to_rename),
+                                                            left_on=id_column, right_on=id_column, how='left')
+    return temp_employee_manager
+
+
+def single_pass_enrichment(temp_employee_manager, employee_id_email):
+    return add_email_columns(temp_employee_manager, build_email_lookup(employee_id_email), EMAIL_COLUMNS)
+
+
+def measured(function, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(*args)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak / 1024 ** 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare merge-based and single-pass employee email enrichment')
+    parser.add_argument('--rows', type=int, default=200000)
+    args = parser.parse_args()
+
+    temp_employee_manager, employee_id_email = make_temp_employee_directory(args.rows)
+    legacy, legacy_seconds, legacy_peak = measured(legacy_enrichment, temp_employee_manager.copy(), employee_id_email)
+    single_pass, single_pass_seconds, single_pass_peak = measured(single_pass_enrichment,
+                                                                   temp_employee_manager.copy(), employee_id_email)
+    columns = list(legacy.columns)
+    same = legacy.astype(object).equals(single_pass[columns].astype(object))
+    print(f'merge x4 ({args.rows} employees): {legacy_seconds:.3f}s, peak {legacy_peak:.1f} MiB')
+    print(f'single pass ({args.rows} employees): {single_pass_seconds:.3f}s, peak {single_pass_peak:.1f} MiB')
+    print(f'speedup {legacy_seconds / max(single_pass_seconds, 1e-9):.1f}x, same result: {same}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+import argparse
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import make_computer_dataframe
+from databases.asset_database import COMPUTER_COLUMN_MAPPING, get_column_types
+from databases.models import Computer
+from tests.table_api_stub import TableApiStub
+from utils.json_reader import read_json_columns
+from utils.servicenow_api import ServiceNowTableClient, export_sn_report
+from utils.xlsx_reader import deduplicate_header, read_xlsx
+
+STUB_COMPUTER_FIELDS = [
+    ['name', 'Name'],
+    ['manufacturer', 'Manufacturer'],
+    ['sys_class_name', 'Class'],
+    ['serial_number', 'Serial number'],
+    ['os', 'Operating System'],
+    ['os_version', 'OS Version'],
+    ['assigned_to.city', 'City'],
+    ['assigned_to.user_name', 'User ID'],
+    ['assigned_to.active', 'Active'],
+    ['assigned_to.vip', 'VIP'],
+    ['assigned_to.title', 'Title'],
+    ['assigned_to.last_login_time', 'Last login time'],
+    ['assigned_to.mobile_phone', 'Mobile phone'],
+    ['assigned_to.employee_number', 'Employee ID'],
+    ['assigned_to.u_business_unit', 'Business Unit'],
+    ['virtual', 'Is Virtual'],
+    ['u_is_deleted', 'Is deleted'],
+    ['last_discovered', 'Most recent discovery'],
+    ['u_last_logged_user', 'Last Logged User'],
+    ['u_last_logged_in_user', 'Last logged in user'],
+    ['location', 'Location'],
+    ['location.city', 'City'],
+    ['location.u_site_code', 'Site Code '],
+]
+
+
+def to_display_value(value):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ''
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, pd.Timestamp):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    return str(value)
+
+
+def make_table_records(dataframe):
+    labels = deduplicate_header([label for _, label in STUB_COMPUTER_FIELDS])
+    fields = {COMPUTER_COLUMN_MAPPING[label]: field for (field, _), label in zip(STUB_COMPUTER_FIELDS, labels)}
+    records = []
+    for sys_id, row in enumerate(dataframe.astype(object).itertuples(index=False)):
+        record = {fields[column_name]: to_display_value(value) for column_name, value in zip(dataframe.columns, row)}
+        record['sys_id'] = f'{sys_id:032x}'
+        records.append(record)
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export cmdb_ci_computer from a local Table API stub server')
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--page-size', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--latency', type=float, default=0.5, help='seconds the stub waits before each page')
+    parser.add_argument('--browser-seconds', type=float, default=None,
+                        help='duration of a measured test_download_sn_report run to compare against')
+    args = parser.parse_args()
+
+    dataframe = make_computer_dataframe(args.rows)
+    column_types = get_column_types(Computer, COMPUTER_COLUMN_MAPPING)
+    with TableApiStub(make_table_records(dataframe), args.latency) as stub, \
+            tempfile.TemporaryDirectory() as directory:
+        for workers in sorted({1, args.workers}):
+            with ServiceNowTableClient(stub.base_url, ('user', 'password'), page_size=args.page_size,
+                                       workers=workers) as client:
+                start = time.perf_counter()
+                excel_file, json_file = export_sn_report(client, STUB_COMPUTER_FIELDS, directory)
+                seconds = time.perf_counter() - start
+            exported = read_xlsx(excel_file, column_types).rename(columns=COMPUTER_COLUMN_MAPPING)
+            sys_ids = read_json_columns(json_file, ['sys_id'])['sys_id']
+            same = exported['serial_number'].tolist() == dataframe['serial_number'].tolist()
+            print(f'{workers} worker(s), {args.rows} rows, page size {args.page_size}: {seconds:.2f}s, '
+                  f'{len(exported)} xlsx rows, {len(sys_ids)} json records, same serial numbers: {same}')
+            if args.browser_seconds:
+                print(f'  speedup over the browser export: {args.browser_seconds / max(seconds, 1e-9):.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import make_employee_manager_dataframe, make_usage_report_dataframe
+from databases.employee_database import normalize_strings
+from generate_usage_report import clean_up_email, is_match
+
+
+def legacy_is_match(row):
+    if row['emp_email'] is not None and row['last_use_employee'] is not None:
+        if row['emp_email'] != '' and row['last_use_employee'] != '':
+            if row['emp_email'] == row['last_use_employee']:
+                return True
+            elif row['employee_band'] == '0' and row['emp_email'] == row['manager_email']:
+                return True
+    return False
+
+
+def legacy_clean_up_email(row):
+    if pd.notna(row['last_use_employee']):
+        email = row['last_use_employee'].lower()
+        if email.endswith('@thermofisher.com'):
+            if len(email.replace('@thermofisher.com', '')) > 32:
+                return email[32:]
+    return row['last_use_employee']
+
+
+def legacy_normalize_strings(dataframe):
+    return dataframe.applymap(lambda x: x.strip().lower() if isinstance(x, str) else x)
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare row-wise and columnar usage report steps')
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    usage = make_usage_report_dataframe(args.rows)
+    employees = make_employee_manager_dataframe(args.rows)
+    cases = [
+        ('is_match', lambda: usage.apply(legacy_is_match, axis=1), lambda: is_match(usage)),
+        ('clean_up_email', lambda: usage.apply(legacy_clean_up_email, axis=1),
+         lambda: clean_up_email(usage['last_use_employee'])),
+        ('normalize_strings', lambda: legacy_normalize_strings(employees), lambda: normalize_strings(employees)),
+    ]
+    for name, legacy, columnar in cases:
+        legacy_result, legacy_seconds = timed(legacy)
+        columnar_result, columnar_seconds = timed(columnar)
+        if isinstance(legacy_result, pd.Series):
+            same = legacy_result.astype(object).equals(columnar_result.astype(object))
+        else:
+            same = legacy_result.equals(columnar_result)
+        print(f'{name} ({args.rows} rows): row-wise {legacy_seconds:.3f}s, columnar {columnar_seconds:.3f}s, '
+              f'speedup {legacy_seconds / max(columnar_seconds, 1e-9):.1f}x, same result: {same}')
+
+
+if __name__ == '__main__':
+    main()
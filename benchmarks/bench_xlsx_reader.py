@@ -0,0 +1,74 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+
+from benchmarks.synthetic import make_computer_dataframe
+from databases.asset_database import COMPUTER_COLUMN_MAPPING, get_column_types
+from databases.models import Computer
+from utils import xlsx_reader
+
+
+def write_computer_export(dataframe, path):
+    labels = {column_name: label for label, column_name in COMPUTER_COLUMN_MAPPING.items()}
+    header = [labels[column_name].replace('City.1', 'City') for column_name in dataframe.columns]
+    with pd.ExcelWriter(path, engine='xlsxwriter',
+                        engine_kwargs={'options': {'constant_memory': True,
+                                                   'default_date_format': 'yyyy-mm-dd hh:mm:ss'}}) as writer:
+        sheet = writer.book.add_worksheet('Page 1')
+        sheet.write_row(0, 0, header)
+        for row, values in enumerate(dataframe.astype(object).where(dataframe.notna(), None).itertuples(index=False),
+                                     start=1):
+            sheet.write_row(row, 0, [value.to_pydatetime() if isinstance(value, pd.Timestamp) else value
+                                     for value in values])
+        writer.book.add_worksheet('Hidden').hide()
+
+
+def legacy_read(path):
+    excel_file = pd.ExcelFile(path)
+    sheets = openpyxl.load_workbook(excel_file, read_only=True).worksheets
+    visible_sheet_name = [sheet.title for sheet in sheets if sheet.sheet_state != 'hidden'][0]
+    return pd.read_excel(excel_file, sheet_name=visible_sheet_name)
+
+
+def normalized(dataframe):
+    dataframe = dataframe.astype(object).where(dataframe.notna(), None)
+    return dataframe.applymap(lambda value: str(int(value)) if isinstance(value, float) and value.is_integer()
+                                else (str(value) if value is not None else None))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare xlsx readers on a synthetic cmdb_ci_computer export')
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory, 'cmdb_ci_computer.xlsx')
+        write_computer_export(make_computer_dataframe(args.rows), path)
+        column_types = get_column_types(Computer, COMPUTER_COLUMN_MAPPING)
+        cases = [('pd.read_excel (legacy)', lambda: legacy_read(path)),
+                 ('openpyxl streaming', lambda: xlsx_reader.read_xlsx(path, column_types, engine='openpyxl'))]
+        if xlsx_reader.python_calamine is not None:
+            cases.append(('calamine streaming', lambda: xlsx_reader.read_xlsx(path, column_types, engine='calamine')))
+        else:
+            print('python-calamine is not installed, skipping the calamine engine')
+
+        baseline = None
+        for name, read in cases:
+            start = time.perf_counter()
+            dataframe = read()
+            seconds = time.perf_counter() - start
+            if baseline is None:
+                baseline = (normalized(dataframe), seconds)
+                print(f'{name} ({args.rows} rows): {seconds:.2f}s')
+                continue
+            same = normalized(dataframe).equals(baseline[0])
+            print(f'{name} ({args.rows} rows): {seconds:.2f}s, speedup {baseline[1] / max(seconds, 1e-9):.1f}x, '
+                  f'same values: {same}')
+
+
+if __name__ == '__main__':
+    main()
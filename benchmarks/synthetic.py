@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+from sqlalchemy import MetaData
+
+from databases.models import Base
+
+
+def make_computer_dataframe(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    serial_numbers = pd.Series(np.arange(rows)).map(lambda x: f'SN{x:010d}')
+    now = pd.Timestamp('2023-07-01')
+    return pd.DataFrame({
+        'name': 'PC-' + serial_numbers.str[-6:],
+        'manufacturer': rng.choice(['Dell', 'Lenovo', 'HP', 'Apple'], rows),
+        'class_': 'Computer',
+        'serial_number': serial_numbers,
+        'operating_system': rng.choice(['Windows 10 Enterprise', 'Windows 11 Enterprise', 'macOS'], rows),
+        'os_version': rng.choice(['10.0.19045', '10.0.22621', '13.4'], rows),
+        'city': rng.choice(['Shanghai', 'Beijing', 'Guangzhou', 'Suzhou'], rows),
+        'user_id': 'user' + pd.Series(rng.integers(0, rows, rows)).astype(str),
+        'active': rng.choice([True, False], rows),
+        'vip': False,
+        'title': 'Engineer',
+        'last_login_time': now - pd.to_timedelta(rng.integers(0, 86400 * 90, rows), unit='s'),
+        'mobile_phone': None,
+        'employee_id': rng.integers(100000, 999999, rows),
+        'business_unit': rng.choice(['BU1', 'BU2', 'BU3'], rows),
+        'is_virtual': False,
+        'is_deleted': False,
+        'most_recent_discovery': now - pd.to_timedelta(rng.integers(0, 86400 * 30, rows), unit='s'),
+        'last_logged_user': 'user' + pd.Series(rng.integers(0, rows, rows)).astype(str),
+        'last_logged_in_user': None,
+        'location': rng.choice(['Site A', 'Site B', 'Site C'], rows),
+        'city_1': None,
+        'site_code': rng.choice(['SH01', 'BJ02', 'GZ03'], rows),
+    })
+
+
+def make_scratch_table_class(table_class, table_name):
+    table = table_class.__table__.to_metadata(MetaData(), name=table_name)
+    for index in table.indexes:
+        if index.name is not None:
+            index.name = index.name.replace(table_class.__tablename__, table_name) \
+                if table_class.__tablename__ in index.name else f'{table_name}_{index.name}'
+    return type(f'Scratch{table_class.__name__}', (Base,), {'__table__': table, '__tablename__': table_name})
+
+
+def make_usage_report_dataframe(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    emails = pd.Series(np.arange(rows // 2 + 1)).map(lambda x: f'user{x}@thermofisher.com')
+    emp_email = pd.Series(rng.choice(emails, rows)).where(rng.random(rows) > 0.1, None)
+    last_use_employee = emp_email.where(rng.random(rows) > 0.3, pd.Series(rng.choice(emails, rows)))
+    last_use_employee = last_use_employee.where(rng.random(rows) > 0.05, '')
+    return pd.DataFrame({
+        'emp_email': emp_email,
+        'last_use_employee': last_use_employee,
+        'employee_band': pd.Series(rng.choice(['0', '1', '2', None], rows)),
+        'manager_email': pd.Series(rng.choice(emails, rows)),
+    })
+
+
+def make_employee_manager_dataframe(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    emails = pd.Series(np.arange(rows)).map(lambda x: f' User{x}@ThermoFisher.com ')
+    return pd.DataFrame({
+        'employee_email': emails.where(rng.random(rows) > 0.05, None),
+        'employee_band': pd.Series(rng.choice([' 0', '1 ', 'Band 2', None], rows)),
+        'manager_email': pd.Series(rng.choice(emails, rows)),
+        'manager_band': pd.Series(rng.choice([' 0', '1 ', 'Band 2', None], rows)),
+    })
+
+
+def make_temp_employee_directory(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    employee_ids = pd.Series(np.arange(rows)).map(lambda x: f'{x:08d}')
+    manager_ids = pd.Series(rng.choice(employee_ids, rows))
+    temp_employee_manager = pd.DataFrame({
+        'employee_id': employee_ids,
+        'employee_name': 'Worker ' + employee_ids,
+        'band': pd.Series(rng.choice(['0', '1', '2', None], rows)),
+        'termination_date': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 365, rows), unit='D'),
+        'manager_id': manager_ids.where(rng.random(rows) > 0.02, None),
+        'manager_name': 'Manager ' + manager_ids,
+        'lvl1_manager_id': pd.Series(rng.choice(employee_ids, rows)),
+        'lvl1_manager_name': 'Lvl1 Manager',
+        'lvl2_manager_id': pd.Series(rng.choice(employee_ids, rows)).where(rng.random(rows) > 0.1, None),
+        'lvl2_manager_name': 'Lvl2 Manager',
+    })
+    employee_id_email = pd.DataFrame({
+        'employee_id': employee_ids,
+        'employee_email': ('user' + employee_ids + '@thermofisher.com').where(rng.random(rows) > 0.05, None),
+    })
+    return temp_employee_manager, employee_id_email
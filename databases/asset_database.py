@@ -1,259 +1,377 @@
-import datetime
-from contextlib import contextmanager
-
-import numpy as np
-import pandas as pd
-from sqlalchemy import func
-from sqlalchemy.dialects.postgresql import insert
-
-from databases.database import Database
-from databases.models import DeviceUsage, Asset, Computer, TempEmployee
-from utils.config import config
-
-
-@contextmanager
-def database_session(session):
-    try:
-        yield session
-    finally:
-        session.close()
-
-
-class AssetDatabase(Database):
-    def __init__(self):
-        super(AssetDatabase, self).__init__('asset')
-
-    def process_dataframe(self, dataframe, not_null_column, reference_columns):
-        df = dataframe.replace({np.nan: None, pd.NaT: None})
-        for _, row in df.iterrows():
-            not_null_value = row[not_null_column]
-            if pd.isnull(not_null_value):
-                print_msg = f"Skipping row with '{not_null_column}' '{not_null_value}' due to null value with"
-                for column in reference_columns:
-                    print_msg += f" '{column}' '{row[column]}'"
-                print(print_msg)
-        df = df.dropna(subset=[not_null_column])
-        duplicates = df[df.duplicated(subset=[not_null_column], keep=False)]
-        for item in duplicates[not_null_column].drop_duplicates():
-            print(f"Skipping row with '{not_null_column}' '{item}' due to duplicate")
-        return df.drop_duplicates(subset=[not_null_column], keep=False)
-
-    def update_or_insert_data(self, table_class, dataframe, column_mapping: dict = None, ignore_fields: list = None,
-                              check_columns: list = None):
-        if column_mapping:
-            dataframe.rename(columns=column_mapping, inplace=True)
-        dataframe['updated_by'] = 'Updated By Script'
-
-        data = dataframe.to_dict(orient='records')
-
-        with database_session(self.session) as session:
-            pk_column_name = self.get_table_primary_key_column_name(table_class)
-            existing_records = session.query(table_class).filter(
-                getattr(table_class, pk_column_name).in_([record[pk_column_name] for record in data])).all()
-            existing_record_dict = {getattr(record, pk_column_name): record for record in existing_records}
-
-            insert_values = []
-            update_values = []
-
-            for record in data:
-                unique_key = record[pk_column_name]
-
-                if unique_key in existing_record_dict:
-                    existing_record = existing_record_dict[unique_key]
-
-                    if check_columns:
-                        check_columns_match = []
-                        for key, value in record.items():
-                            if key in check_columns:
-                                if getattr(existing_record, key) == value:
-                                    check_columns_match.append(True)
-                                else:
-                                    check_columns_match.append(False)
-                        if all(check_columns_match):
-                            continue
-
-                    for key, value in record.items():
-                        if ignore_fields and key in ignore_fields:
-                            continue
-                        setattr(existing_record, key, value)
-                    update_values.append(existing_record)
-                else:
-                    insert_values.append(record)
-
-            if insert_values:
-                insert_stmt = insert(table_class).values(insert_values)
-                session.execute(insert_stmt)
-
-            if update_values:
-                update_values_dict = []
-                for update_record in update_values:
-                    if column_mapping:
-                        update_dict = {key: getattr(update_record, key) for key in column_mapping.values()}
-                    else:
-                        update_dict = {key: getattr(update_record, key) for key in dataframe.columns.values}
-                    update_dict['updated_by'] = 'Updated By Script'
-                    update_dict['updated_time'] = func.timezone('Asia/Shanghai', func.now())
-                    update_values_dict.append(update_dict)
-
-                update_stmt = insert(table_class).values(update_values_dict)
-                update_stmt = update_stmt.on_conflict_do_update(
-                    constraint=self.get_table_constraint_name(table_class),
-                    set_=update_stmt.excluded
-                )
-                session.execute(update_stmt)
-
-            session.commit()
-
-    def update_or_insert_sn_asset_data(self, table_class, dataframe):
-        column_mapping = {
-            'Name': 'name',
-            'Manufacturer': 'manufacturer',
-            'Class': 'class_',
-            'Serial number': 'serial_number',
-            'Operating System': 'operating_system',
-            'OS Version': 'os_version',
-            'City': 'city',
-            'User ID': 'user_id',
-            'Active': 'active',
-            'VIP': 'vip',
-            'Title': 'title',
-            'Last login time': 'last_login_time',
-            'Mobile phone': 'mobile_phone',
-            'Employee ID': 'employee_id',
-            'Business Unit': 'business_unit',
-            'Is Virtual': 'is_virtual',
-            'Is deleted': 'is_deleted',
-            'Most recent discovery': 'most_recent_discovery',
-            'Last Logged User': 'last_logged_user',
-            'Last logged in user': 'last_logged_in_user',
-            'Location': 'location',
-            'City.1': 'city_1',
-            'Site Code ': 'site_code',
-        }
-        ignore_fields = ['updated_time']
-        df = self.process_dataframe(dataframe, 'Serial number', ['Name'])
-        self.update_or_insert_data(table_class, df, column_mapping, ignore_fields)
-
-    def update_or_insert_sn_asset_sys_mapping_data(self, table_class, dataframe):
-        ignore_fields = ['updated_time']
-        df = self.process_dataframe(dataframe, 'sys_id', ['serial_number'])
-        self.update_or_insert_data(table_class, df, None, ignore_fields)
-
-    def update_or_insert_asset_data(self, table_class, dataframe):
-        column_mapping = {
-            '状态': 'status',
-            '用户确认': 'confirmation',
-            '盘点时间': 'inv_time',
-            'PO No': 'po_number',
-            '资产条码': 'barcode',
-            '资产名称': 'asset_name',
-            '成本中心(charge)': 'cost_ctr',
-            '资产类别编码': 'class_code',
-            '资产类别': 'asset_class',
-            '规格型号': 'spec_model',
-            'SN号': 'serial_nu',
-            '计量单位': 'measure_unit',
-            '金额': 'amount',
-            '使用公司编码': 'use_comp_code',
-            '使用公司': 'use_comp',
-            '使用部门编码': 'use_dept_code',
-            '使用部门': 'use_dept',
-            'BusinessUnit': 'unit',
-            '领用人成本中心': 'recipient_cost',
-            '员工号': 'emp_id',
-            '员工邮箱': 'emp_email',
-            '使用人': 'user',
-            '在职状态': 'emp_status',
-            '离职日期': 'dept_date',
-            '区域编码': 'region_code',
-            '区域': 'region',
-            '存放地点': 'storage_loc',
-            '管理员': 'administrator',
-            '所属公司编码': 'comp_code',
-            '所属公司': 'comp',
-            '购入时间': 'purchase_dt',
-            '供应商': 'supplier',
-            '使用期限': 'use_period',
-            '备注': 'remark',
-            '创建时间': 'creation_time',
-            '最后更新时间': 'last_updated',
-            '照片': 'photo',
-            '错误反馈': 'error_feedback',
-            '待归还时间': 'return_dt',
-            '待归还说明': 'return_instr',
-            '合约结束': 'contract_end',
-            '合约记录': 'contract_rec',
-            '原资产处理状态': 'proc_status',
-            '用户身份变更': 'identity_change',
-            '物品描述': 'item_desc',
-            '领用备注': 'receipt_remarks',
-            '领用说明': 'receipt_instr',
-            '退库说明': 'return_back_instr',
-            '清理说明': 'cleanup_instr',
-            '扩展字段': 'ext_field'
-        }
-        ignore_fields = ['updated_time']
-        df = self.process_dataframe(dataframe, 'SN号', ['资产条码', '员工号'])
-        self.update_or_insert_data(table_class, df, column_mapping, ignore_fields)
-
-    def update_or_insert_device_usage_data(self, table_class, dataframe):
-        column_mapping = {
-            'Device ID': 'device_id',
-            'Device name': 'device_name',
-            'Managed by': 'managed_by',
-            'Ownership': 'ownership',
-            'Compliance': 'compliance',
-            'OS': 'os',
-            'OS version': 'os_version',
-            'Primary user UPN': 'last_use_user',
-            'Last check-in': 'last_use_time',
-            'Serial number': 'serial_nu'
-        }
-        ignore_fields = ['updated_time']
-        df = self.process_dataframe(dataframe, 'Device ID', ['Device name'])
-        self.update_or_insert_data(table_class, df, column_mapping, ignore_fields)
-
-    def get_usage_info(self):
-        with database_session(self.session) as session:
-            query = session.query(
-                Asset.serial_nu.label('serial_nu'),
-                func.coalesce(DeviceUsage.device_name, Computer.name).label('device_name'),
-                func.coalesce(DeviceUsage.os, Computer.operating_system).label('os'),
-                func.coalesce(DeviceUsage.os_version, Computer.os_version).label('os_version'),
-                func.coalesce(DeviceUsage.last_use_time, Computer.last_login_time).label('last_use_time'),
-                func.coalesce(DeviceUsage.last_use_user, Computer.last_logged_user).label('last_use_employee')
-            ).outerjoin(
-                DeviceUsage, func.lower(func.trim(Asset.serial_nu)) == func.lower(func.trim(DeviceUsage.serial_nu))
-            ).outerjoin(
-                Computer, func.lower(func.trim(Asset.serial_nu)) == func.lower(func.trim(Computer.serial_number))
-            )
-            results = pd.DataFrame(query.all())
-            results = results.replace({np.nan: None, pd.NaT: None})
-            results['serial_nu'] = results['serial_nu'].map(lambda x: x.upper() if isinstance(x, str) else x)
-            return results
-
-    def update_or_insert_temp_employee_manager_mapping(self, table_class, dataframe, changed_rows):
-        ignore_fields = ['updated_time']
-
-        with database_session(self.session) as session:
-            existing_records = session.query(table_class.employee_id, table_class.first_snapshot,
-                                             table_class.last_change).all()
-            existing_records = pd.DataFrame(existing_records, columns=['employee_id', 'first_snapshot', 'last_change'])
-            df = dataframe.merge(existing_records, on='employee_id', how='left')
-            df = df.replace({np.nan: None, pd.NaT: None})
-            df['first_snapshot'].fillna(config.CST_NOW, inplace=True)
-            rows = df[df['employee_id'].isin(changed_rows['employee_id'])]
-            df.loc[rows.index, 'last_change'] = config.CST_NOW
-            self.update_or_insert_data(table_class, df, column_mapping=None, ignore_fields=ignore_fields)
-
-    def get_historical_temp_employee_manager_mapping(self, day=config.CST_NOW):
-        with database_session(self.session) as session:
-            results = session.query(TempEmployee).filter(
-                TempEmployee.updated_time >= f"{(day - datetime.timedelta(days=1)).strftime('%Y-%m-%d 00:00:00')}",
-                TempEmployee.updated_time < f"{(day + datetime.timedelta(days=1)).strftime('%Y-%m-%d 00:00:00')}").all()
-            column_names = [col.name for col in TempEmployee.__table__.columns]
-            results = [dict(zip(column_names, [getattr(row, col) for col in column_names])) for row in results]
-            results = pd.DataFrame(results)
-            results = results.replace({np.nan: None, pd.NaT: None})
-            results = results.drop(['updated_by', 'updated_time'], axis=1)
-            return results
+import datetime
+import os
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import column, func, literal_column, select, table, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+from databases import bulk_loader
+from databases.database import Database
+from databases.models import DeviceUsage, Asset, Computer, TempEmployee, ROW_HASH_COLUMN
+from utils.config import config
+from utils.diff import get_table_column_types, row_fingerprints
+
+POSTGRESQL_MAX_PARAMETERS = 65535
+USAGE_INFO_VIEW_NAME = 'usage_info_view'
+ASSET_INFO_CATEGORICAL_COLUMNS = ['status', 'confirmation', 'emp_status', 'region', 'unit']
+USAGE_INFO_CATEGORICAL_COLUMNS = ['os']
+
+COMPUTER_COLUMN_MAPPING = {
+    'Name': 'name',
+    'Manufacturer': 'manufacturer',
+    'Class': 'class_',
+    'Serial number': 'serial_number',
+    'Operating System': 'operating_system',
+    'OS Version': 'os_version',
+    'City': 'city',
+    'User ID': 'user_id',
+    'Active': 'active',
+    'VIP': 'vip',
+    'Title': 'title',
+    'Last login time': 'last_login_time',
+    'Mobile phone': 'mobile_phone',
+    'Employee ID': 'employee_id',
+    'Business Unit': 'business_unit',
+    'Is Virtual': 'is_virtual',
+    'Is deleted': 'is_deleted',
+    'Most recent discovery': 'most_recent_discovery',
+    'Last Logged User': 'last_logged_user',
+    'Last logged in user': 'last_logged_in_user',
+    'Location': 'location',
+    'City.1': 'city_1',
+    'Site Code ': 'site_code',
+}
+
+ASSET_COLUMN_MAPPING = {
+    '状态': 'status',
+    '用户确认': 'confirmation',
+    '盘点时间': 'inv_time',
+    'PO No': 'po_number',
+    '资产条码': 'barcode',
+    '资产名称': 'asset_name',
+    '成本中心(charge)': 'cost_ctr',
+    '资产类别编码': 'class_code',
+    '资产类别': 'asset_class',
+    '规格型号': 'spec_model',
+    'SN号': 'serial_nu',
+    '计量单位': 'measure_unit',
+    '金额': 'amount',
+    '使用公司编码': 'use_comp_code',
+    '使用公司': 'use_comp',
+    '使用部门编码': 'use_dept_code',
+    '使用部门': 'use_dept',
+    'BusinessUnit': 'unit',
+    '领用人成本中心': 'recipient_cost',
+    '员工号': 'emp_id',
+    '员工邮箱': 'emp_email',
+    '使用人': 'user',
+    '在职状态': 'emp_status',
+    '离职日期': 'dept_date',
+    '区域编码': 'region_code',
+    '区域': 'region',
+    '存放地点': 'storage_loc',
+    '管理员': 'administrator',
+    '所属公司编码': 'comp_code',
+    '所属公司': 'comp',
+    '购入时间': 'purchase_dt',
+    '供应商': 'supplier',
+    '使用期限': 'use_period',
+    '备注': 'remark',
+    '创建时间': 'creation_time',
+    '最后更新时间': 'last_updated',
+    '照片': 'photo',
+    '错误反馈': 'error_feedback',
+    '待归还时间': 'return_dt',
+    '待归还说明': 'return_instr',
+    '合约结束': 'contract_end',
+    '合约记录': 'contract_rec',
+    '原资产处理状态': 'proc_status',
+    '用户身份变更': 'identity_change',
+    '物品描述': 'item_desc',
+    '领用备注': 'receipt_remarks',
+    '领用说明': 'receipt_instr',
+    '退库说明': 'return_back_instr',
+    '清理说明': 'cleanup_instr',
+    '扩展字段': 'ext_field'
+}
+
+DEVICE_USAGE_COLUMN_MAPPING = {
+    'Device ID': 'device_id',
+    'Device name': 'device_name',
+    'Managed by': 'managed_by',
+    'Ownership': 'ownership',
+    'Compliance': 'compliance',
+    'OS': 'os',
+    'OS version': 'os_version',
+    'Primary user UPN': 'last_use_user',
+    'Last check-in': 'last_use_time',
+    'Serial number': 'serial_nu'
+}
+
+
+@contextmanager
+def database_session(session):
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def get_update_columns(upsert_stmt, columns, pk_column_name, ignore_fields: list = None):
+    update_columns = {
+        column: upsert_stmt.excluded[column] for column in columns
+        if column != pk_column_name and not (ignore_fields and column in ignore_fields)
+    }
+    update_columns['updated_time'] = func.timezone('Asia/Shanghai', func.now())
+    return update_columns
+
+
+def on_conflict_update_changed(upsert_stmt, table_class, constraint_name, update_columns, compare_columns: list = None):
+    where = None
+    if compare_columns:
+        where = tuple_(*[table_class.__table__.c[column] for column in compare_columns]).is_distinct_from(
+            tuple_(*[upsert_stmt.excluded[column] for column in compare_columns]))
+    upsert_stmt = upsert_stmt.on_conflict_do_update(constraint=constraint_name, set_=update_columns, where=where)
+    return upsert_stmt.returning(literal_column('xmax = 0').label('inserted'))
+
+
+def count_upserted_rows(result, total):
+    inserted_flags = result.scalars().all()
+    inserted = sum(inserted_flags)
+    updated = len(inserted_flags) - inserted
+    return {'inserted': inserted, 'updated': updated, 'unchanged': total - inserted - updated}
+
+
+def get_row_hashes(table_class, dataframe, ignore_fields: list = None):
+    excluded_columns = [ROW_HASH_COLUMN, 'updated_by', 'updated_time'] + (ignore_fields or [])
+    hash_columns = [column.name for column in table_class.__table__.columns
+                    if column.name in dataframe.columns and column.name not in excluded_columns]
+    return row_fingerprints(dataframe, hash_columns, get_table_column_types(table_class)).to_numpy().view(np.int64)
+
+
+def get_column_types(table_class, column_mapping):
+    return {label: table_class.__table__.c[column_name].type for label, column_name in column_mapping.items()}
+
+
+def split_rejected_rows(dataframe, not_null_column, duplicate_values=None):
+    null_rows = dataframe[not_null_column].isna()
+    duplicate_rows = dataframe.duplicated(subset=[not_null_column], keep=False)
+    if duplicate_values is not None:
+        duplicate_rows |= dataframe[not_null_column].isin(duplicate_values)
+    duplicate_rows &= ~null_rows
+    rejects = dataframe[null_rows | duplicate_rows].copy()
+    rejects.insert(0, 'reject_reason', np.where(null_rows[rejects.index], 'null value', 'duplicate'))
+    return dataframe[~(null_rows | duplicate_rows)], rejects
+
+
+class AssetDatabase(Database):
+    def __init__(self):
+        super(AssetDatabase, self).__init__('asset')
+
+    def process_dataframe(self, dataframe, not_null_column, reference_columns, rejects_file=None,
+                          duplicate_values=None, append_rejects=False):
+        df, rejects = split_rejected_rows(dataframe, not_null_column, duplicate_values)
+        if not rejects.empty:
+            print(f"Skipping {len(rejects)} rows with null or duplicate '{not_null_column}':")
+            print(rejects[['reject_reason', not_null_column] + reference_columns].to_string())
+            if rejects_file:
+                append_rejects = append_rejects and os.path.exists(rejects_file)
+                rejects.to_csv(rejects_file, index_label='row', mode='a' if append_rejects else 'w',
+                               header=not append_rejects)
+                print(f"Rejected rows are written to {rejects_file}")
+        return df.astype(object).where(df.notna(), None)
+
+    def update_or_insert_data(self, table_class, dataframe, column_mapping: dict = None, ignore_fields: list = None,
+                              check_columns: list = None, batch_size: int = config.UPSERT_BATCH_SIZE,
+                              skip_unchanged: bool = config.UPSERT_SKIP_UNCHANGED, snapshot=None):
+        if column_mapping:
+            dataframe.rename(columns=column_mapping, inplace=True)
+        if snapshot is not None:
+            snapshot.write(dataframe)
+        dataframe['updated_by'] = 'Updated By Script'
+
+        pk_column_name = self.get_table_primary_key_column_name(table_class)
+        compare_columns = check_columns
+        if ROW_HASH_COLUMN in table_class.__table__.columns:
+            dataframe[ROW_HASH_COLUMN] = get_row_hashes(table_class, dataframe, ignore_fields)
+            if not compare_columns and skip_unchanged:
+                compare_columns = [ROW_HASH_COLUMN]
+        if not compare_columns and skip_unchanged:
+            compare_columns = [column for column in dataframe.columns
+                               if column not in [pk_column_name, 'updated_by', 'updated_time'] + (ignore_fields or [])]
+
+        if table_class.__tablename__ in config.BULK_LOAD_TABLES:
+            counts = self.copy_update_or_insert_data(table_class, dataframe, ignore_fields, batch_size,
+                                                     compare_columns)
+        else:
+            counts = self._update_or_insert_data_in_batches(table_class, dataframe, ignore_fields, batch_size,
+                                                            compare_columns)
+        print(f"Upserted '{table_class.__tablename__}': {counts['inserted']} inserted, {counts['updated']} updated, "
+              f"{counts['unchanged']} unchanged")
+        return counts
+
+    def _update_or_insert_data_in_batches(self, table_class, dataframe, ignore_fields: list = None,
+                                          batch_size: int = config.UPSERT_BATCH_SIZE, compare_columns: list = None):
+        pk_column_name = self.get_table_primary_key_column_name(table_class)
+        constraint_name = self.get_table_constraint_name(table_class)
+        batch_size = max(min(batch_size, POSTGRESQL_MAX_PARAMETERS // len(dataframe.columns)), 1)
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        with database_session(self.session) as session:
+            for start in range(0, len(dataframe), batch_size):
+                chunk = dataframe.iloc[start:start + batch_size]
+                try:
+                    upsert_stmt = insert(table_class).values(chunk.to_dict(orient='records'))
+                    upsert_stmt = on_conflict_update_changed(
+                        upsert_stmt, table_class, constraint_name,
+                        get_update_columns(upsert_stmt, chunk.columns, pk_column_name, ignore_fields), compare_columns
+                    )
+                    chunk_counts = count_upserted_rows(session.execute(upsert_stmt), len(chunk))
+                    session.commit()
+                except Exception:
+                    session.rollback()
+                    print(f"Failed to upsert rows {start} to {start + len(chunk)} into '{table_class.__tablename__}'")
+                    raise
+                for key, value in chunk_counts.items():
+                    counts[key] += value
+        return counts
+
+    def copy_update_or_insert_data(self, table_class, dataframe, ignore_fields: list = None,
+                                   batch_size: int = config.UPSERT_BATCH_SIZE, compare_columns: list = None):
+        pk_column_name = self.get_table_primary_key_column_name(table_class)
+        constraint_name = self.get_table_constraint_name(table_class)
+        columns = dataframe.columns.tolist()
+        with database_session(self.session) as session:
+            try:
+                with session.connection().connection.cursor() as cursor:
+                    staging_table_name = bulk_loader.create_staging_table(cursor, table_class)
+                    bulk_loader.copy_dataframe(cursor, table_class, staging_table_name, dataframe, batch_size)
+                upsert_stmt = insert(table_class).from_select(
+                    columns, bulk_loader.select_staging_table(staging_table_name, columns))
+                upsert_stmt = on_conflict_update_changed(
+                    upsert_stmt, table_class, constraint_name,
+                    get_update_columns(upsert_stmt, columns, pk_column_name, ignore_fields), compare_columns
+                )
+                counts = count_upserted_rows(session.execute(upsert_stmt), len(dataframe))
+                session.commit()
+            except Exception:
+                session.rollback()
+                print(f"Failed to bulk load {len(dataframe)} rows into '{table_class.__tablename__}'")
+                raise
+        return counts
+
+    def update_or_insert_sn_asset_data(self, table_class, dataframe, rejects_file=None, snapshot=None):
+        ignore_fields = ['updated_time']
+        df = self.process_dataframe(dataframe, 'Serial number', ['Name'], rejects_file)
+        return self.update_or_insert_data(table_class, df, COMPUTER_COLUMN_MAPPING, ignore_fields, snapshot=snapshot)
+
+    def update_or_insert_sn_asset_sys_mapping_data(self, table_class, dataframe, rejects_file=None, snapshot=None,
+                                                   duplicate_values=None, append_rejects=False):
+        ignore_fields = ['updated_time']
+        df = self.process_dataframe(dataframe, 'sys_id', ['serial_number'], rejects_file, duplicate_values,
+                                    append_rejects)
+        return self.update_or_insert_data(table_class, df, None, ignore_fields, snapshot=snapshot)
+
+    def update_or_insert_asset_data(self, table_class, dataframe, rejects_file=None, snapshot=None):
+        ignore_fields = ['updated_time']
+        df = self.process_dataframe(dataframe, 'SN号', ['资产条码', '员工号'], rejects_file)
+        return self.update_or_insert_data(table_class, df, ASSET_COLUMN_MAPPING, ignore_fields, snapshot=snapshot)
+
+    def update_or_insert_device_usage_data(self, table_class, dataframe, rejects_file=None, snapshot=None,
+                                           duplicate_values=None, append_rejects=False):
+        ignore_fields = ['updated_time']
+        df = self.process_dataframe(dataframe, 'Device ID', ['Device name'], rejects_file, duplicate_values,
+                                    append_rejects)
+        return self.update_or_insert_data(table_class, df, DEVICE_USAGE_COLUMN_MAPPING, ignore_fields,
+                                          snapshot=snapshot)
+
+    @staticmethod
+    def get_usage_info_statement():
+        return select(
+            Asset.serial_nu.label('serial_nu'),
+            func.coalesce(DeviceUsage.device_name, Computer.name).label('device_name'),
+            func.coalesce(DeviceUsage.os, Computer.operating_system).label('os'),
+            func.coalesce(DeviceUsage.os_version, Computer.os_version).label('os_version'),
+            func.coalesce(DeviceUsage.last_use_time, Computer.last_login_time).label('last_use_time'),
+            func.coalesce(DeviceUsage.last_use_user, Computer.last_logged_user).label('last_use_employee')
+        ).outerjoin(
+            DeviceUsage, func.lower(func.trim(Asset.serial_nu)) == func.lower(func.trim(DeviceUsage.serial_nu))
+        ).outerjoin(
+            Computer, func.lower(func.trim(Asset.serial_nu)) == func.lower(func.trim(Computer.serial_number))
+        )
+
+    def create_usage_info_view(self):
+        for table_class in [Asset, DeviceUsage, Computer]:
+            self.create_table_if_not_exists(table_class)
+        statement = self.get_usage_info_statement().compile(self.engine, compile_kwargs={'literal_binds': True})
+        with database_session(self.session) as session:
+            session.execute(text(f'CREATE MATERIALIZED VIEW IF NOT EXISTS {USAGE_INFO_VIEW_NAME} AS {statement}'))
+            session.commit()
+
+    def refresh_usage_info_view(self):
+        self.create_usage_info_view()
+        with database_session(self.session) as session:
+            session.execute(text(f'REFRESH MATERIALIZED VIEW {USAGE_INFO_VIEW_NAME}'))
+            session.commit()
+        print(f"Refreshed materialized view '{USAGE_INFO_VIEW_NAME}'")
+
+    def get_usage_info_view(self):
+        return table(USAGE_INFO_VIEW_NAME, *[column(selected.name, selected.type)
+                                             for selected in self.get_usage_info_statement().selected_columns])
+
+    def get_usage_info(self):
+        statement = self.get_usage_info_statement()
+        if config.USAGE_INFO_MATERIALIZED_VIEW:
+            statement = select(*self.get_usage_info_view().c)
+        results = self.fetch_dataframe(statement, categorical_columns=USAGE_INFO_CATEGORICAL_COLUMNS)
+        results['serial_nu'] = results['serial_nu'].str.upper()
+        return results
+
+    def get_asset_info_columns(self):
+        return [column for column in Asset.__table__.columns
+                if column.name not in ['updated_by', 'updated_time', ROW_HASH_COLUMN]]
+
+    def get_asset_info(self):
+        return self.fetch_dataframe(select(*self.get_asset_info_columns()),
+                                    categorical_columns=ASSET_INFO_CATEGORICAL_COLUMNS)
+
+    def get_asset_usage_info_statement(self):
+        asset_columns = self.get_asset_info_columns()
+        if config.USAGE_INFO_MATERIALIZED_VIEW:
+            usage_info_view = self.get_usage_info_view()
+            usage_columns = [selected for selected in usage_info_view.c if selected.name != 'serial_nu']
+            return select(*asset_columns, *usage_columns).outerjoin(
+                usage_info_view, usage_info_view.c.serial_nu == Asset.serial_nu)
+        statement = self.get_usage_info_statement()
+        usage_columns = [selected for selected in statement.selected_columns if selected.name != 'serial_nu']
+        return statement.with_only_columns(*asset_columns, *usage_columns)
+
+    def iter_asset_usage_info(self, chunk_size: int = config.FETCH_CHUNK_SIZE):
+        categorical_columns = ASSET_INFO_CATEGORICAL_COLUMNS + USAGE_INFO_CATEGORICAL_COLUMNS
+        for chunk in self.iter_dataframes(self.get_asset_usage_info_statement(), categorical_columns, chunk_size):
+            chunk['serial_nu'] = chunk['serial_nu'].str.upper()
+            yield chunk
+
+    def update_or_insert_temp_employee_manager_mapping(self, table_class, dataframe, changed_rows):
+        ignore_fields = ['updated_time']
+
+        with database_session(self.session) as session:
+            existing_records = session.query(table_class.employee_id, table_class.first_snapshot,
+                                             table_class.last_change).all()
+            existing_records = pd.DataFrame(existing_records, columns=['employee_id', 'first_snapshot', 'last_change'])
+            df = dataframe.merge(existing_records, on='employee_id', how='left')
+            df = df.replace({np.nan: None, pd.NaT: None})
+            df['first_snapshot'].fillna(config.CST_NOW, inplace=True)
+            rows = df[df['employee_id'].isin(changed_rows['employee_id'])]
+            df.loc[rows.index, 'last_change'] = config.CST_NOW
+            return self.update_or_insert_data(table_class, df, column_mapping=None, ignore_fields=ignore_fields,
+                                              skip_unchanged=False)
+
+    def get_historical_temp_employee_manager_mapping(self, day=config.CST_NOW):
+        columns = [column for column in TempEmployee.__table__.columns
+                   if column.name not in ['updated_by', 'updated_time']]
+        statement = select(*columns).where(
+            TempEmployee.updated_time >= f"{(day - datetime.timedelta(days=1)).strftime('%Y-%m-%d 00:00:00')}",
+            TempEmployee.updated_time < f"{(day + datetime.timedelta(days=1)).strftime('%Y-%m-%d 00:00:00')}")
+        return self.fetch_dataframe(statement)
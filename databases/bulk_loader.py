@@ -0,0 +1,40 @@
+import io
+
+import pandas as pd
+from sqlalchemy import Integer, column, select, table
+
+COPY_NULL = r'\N'
+
+
+def create_staging_table(cursor, table_class):
+    staging_table_name = f'staging_{table_class.__tablename__}'
+    cursor.execute(f'CREATE TEMP TABLE "{staging_table_name}" '
+                   f'(LIKE "{table_class.__tablename__}" INCLUDING DEFAULTS) ON COMMIT DROP')
+    return staging_table_name
+
+
+def cast_integer_columns(table_class, dataframe):
+    integer_columns = [col.name for col in table_class.__table__.columns
+                       if isinstance(col.type, Integer) and col.name in dataframe.columns]
+    if not integer_columns:
+        return dataframe
+    dataframe = dataframe.copy()
+    for column_name in integer_columns:
+        dataframe[column_name] = pd.to_numeric(dataframe[column_name]).astype('Int64')
+    return dataframe
+
+
+def copy_dataframe(cursor, table_class, staging_table_name, dataframe, batch_size):
+    columns = ', '.join(f'"{column_name}"' for column_name in dataframe.columns)
+    copy_sql = f"COPY \"{staging_table_name}\" ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+    for start in range(0, len(dataframe), batch_size):
+        chunk = cast_integer_columns(table_class, dataframe.iloc[start:start + batch_size])
+        buffer = io.StringIO()
+        chunk.to_csv(buffer, index=False, header=False, na_rep=COPY_NULL)
+        buffer.seek(0)
+        cursor.copy_expert(copy_sql, buffer)
+
+
+def select_staging_table(staging_table_name, columns):
+    staging_table = table(staging_table_name, *[column(column_name) for column_name in columns])
+    return select(*[staging_table.c[column_name] for column_name in columns])
@@ -1,42 +1,188 @@
-from urllib.parse import quote
-
-from decouple import config as decouple_config
-from sqlalchemy import create_engine, inspect, MetaData, Table
-from sqlalchemy.orm import sessionmaker
-
-
-class Database(object):
-
-    def __init__(self, database_name: str):
-        self.database_name = database_name
-        self.engine = self._create_engine()
-        self.session = self._create_session()
-
-    def _create_engine(self):
-        name = self.database_name.upper()
-        adapter = decouple_config(f'{name}_ADAPTER')
-        host = decouple_config(f'{name}_HOST')
-        port = decouple_config(f'{name}_PORT')
-        user = decouple_config(f'{name}_USER')
-        password = decouple_config(f'{name}_PASSWORD')
-        database_str = decouple_config(f'{name}_DATABASE_STR')
-        db_uri = f'{adapter}://{user}:%s@{host}:{port}/{database_str}' % quote(password)
-        return create_engine(db_uri, echo=False)
-
-    def _create_session(self):
-        Session = sessionmaker(bind=self.engine)
-        return Session()
-
-    def create_table_if_not_exists(self, table_class):
-        inspector = inspect(self.session.bind)
-        if not inspector.has_table(table_class.__tablename__):
-            table_class.__table__.create(self.session.bind)
-
-    def get_table_primary_key_column_name(self, table_class):
-        table = Table(table_class.__tablename__, MetaData(), autoload_with=self.engine)
-        return table.primary_key.columns.values()[0].name
-
-    def get_table_constraint_name(self, table_class):
-        table = Table(table_class.__tablename__, MetaData(), autoload_with=self.engine)
-        constraints = table.constraints
-        return next(iter(constraints)).name
+import threading
+from urllib.parse import quote
+
+import pandas as pd
+from decouple import config as decouple_config
+from sqlalchemy import create_engine, inspect, MetaData, Table, text, Boolean, DateTime, Integer
+from sqlalchemy.orm import sessionmaker
+
+from utils.config import config
+
+
+class SchemaCache(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reflected_tables = {}
+        self._existing_tables = set()
+
+    @staticmethod
+    def _key(engine, table_name):
+        return str(engine.url), table_name
+
+    def reflect(self, engine, table_name):
+        key = self._key(engine, table_name)
+        with self._lock:
+            if key not in self._reflected_tables:
+                self._reflected_tables[key] = Table(table_name, MetaData(), autoload_with=engine)
+            return self._reflected_tables[key]
+
+    def is_table_known(self, engine, table_name):
+        with self._lock:
+            return self._key(engine, table_name) in self._existing_tables
+
+    def add_table(self, engine, table_name):
+        with self._lock:
+            self._existing_tables.add(self._key(engine, table_name))
+
+    def invalidate(self, engine=None, table_name=None):
+        def is_stale(key):
+            return (engine is None or key[0] == str(engine.url)) and (table_name is None or key[1] == table_name)
+
+        with self._lock:
+            self._reflected_tables = {key: table for key, table in self._reflected_tables.items() if not is_stale(key)}
+            self._existing_tables = {key for key in self._existing_tables if not is_stale(key)}
+
+
+schema_cache = SchemaCache()
+
+
+class EngineRegistry(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engines = {}
+
+    @staticmethod
+    def _create_engine(database_name):
+        name = database_name.upper()
+        adapter = decouple_config(f'{name}_ADAPTER')
+        host = decouple_config(f'{name}_HOST')
+        port = decouple_config(f'{name}_PORT')
+        user = decouple_config(f'{name}_USER')
+        password = decouple_config(f'{name}_PASSWORD')
+        database_str = decouple_config(f'{name}_DATABASE_STR')
+        db_uri = f'{adapter}://{user}:%s@{host}:{port}/{database_str}' % quote(password)
+        return create_engine(
+            db_uri,
+            echo=False,
+            pool_size=decouple_config(f'{name}_POOL_SIZE', default=5, cast=int),
+            max_overflow=decouple_config(f'{name}_POOL_MAX_OVERFLOW', default=10, cast=int),
+            pool_pre_ping=decouple_config(f'{name}_POOL_PRE_PING', default=True, cast=bool),
+            pool_recycle=decouple_config(f'{name}_POOL_RECYCLE', default=1800, cast=int),
+        )
+
+    def get_engine(self, database_name):
+        with self._lock:
+            if database_name not in self._engines:
+                self._engines[database_name] = self._create_engine(database_name)
+            return self._engines[database_name]
+
+    def dispose(self, database_name=None):
+        with self._lock:
+            names = [database_name] if database_name is not None else list(self._engines)
+            for name in names:
+                engine = self._engines.pop(name, None)
+                if engine is not None:
+                    engine.dispose()
+
+
+engine_registry = EngineRegistry()
+
+
+def cast_column(values, column_type):
+    if isinstance(column_type, Boolean):
+        return values.astype('boolean')
+    if isinstance(column_type, Integer):
+        return values.astype('Int64')
+    if isinstance(column_type, DateTime):
+        return pd.to_datetime(values, utc=bool(column_type.timezone))
+    return values
+
+
+def build_typed_dataframe(columns, column_types, rows):
+    dataframe = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+    for column_name, column_type in zip(columns, column_types):
+        dataframe[column_name] = cast_column(dataframe[column_name], column_type)
+    return dataframe
+
+
+def cast_categorical_columns(dataframe, categorical_columns: list = None):
+    for column_name in categorical_columns or []:
+        if column_name in dataframe.columns:
+            dataframe[column_name] = dataframe[column_name].astype('category')
+    return dataframe
+
+
+class Database(object):
+
+    def __init__(self, database_name: str):
+        self.database_name = database_name
+        self.engine = self._create_engine()
+        self.session = self._create_session()
+
+    def _create_engine(self):
+        return engine_registry.get_engine(self.database_name)
+
+    def _create_session(self):
+        Session = sessionmaker(bind=self.engine)
+        return Session()
+
+    def create_table_if_not_exists(self, table_class):
+        table_name = table_class.__tablename__
+        if schema_cache.is_table_known(self.engine, table_name):
+            return
+        inspector = inspect(self.engine)
+        if inspector.has_table(table_name):
+            existing_columns = {column['name'] for column in inspector.get_columns(table_name)}
+            self.add_missing_columns(table_class, existing_columns)
+            for index in table_class.__table__.indexes:
+                index.create(self.engine, checkfirst=True)
+        else:
+            table_class.__table__.create(self.engine)
+            schema_cache.invalidate(self.engine, table_name)
+        schema_cache.add_table(self.engine, table_name)
+
+    def add_missing_columns(self, table_class, existing_columns: set):
+        columns = [column for column in table_class.__table__.columns
+                   if column.info.get('add_if_missing') and column.name not in existing_columns]
+        if not columns:
+            return
+        with self.engine.begin() as connection:
+            for column in columns:
+                column_type = column.type.compile(dialect=self.engine.dialect)
+                connection.execute(text(f'ALTER TABLE "{table_class.__tablename__}" '
+                                        f'ADD COLUMN IF NOT EXISTS "{column.name}" {column_type}'))
+        print(f"Added columns {[column.name for column in columns]} to '{table_class.__tablename__}'")
+        schema_cache.invalidate(self.engine, table_class.__tablename__)
+
+    def invalidate_schema_cache(self, table_class=None):
+        schema_cache.invalidate(self.engine, table_class.__tablename__ if table_class is not None else None)
+
+    def get_table_primary_key_column_name(self, table_class):
+        primary_key = table_class.__table__.primary_key
+        if not primary_key.columns:
+            primary_key = schema_cache.reflect(self.engine, table_class.__tablename__).primary_key
+        return primary_key.columns.values()[0].name
+
+    def get_table_constraint_name(self, table_class):
+        constraint_name = table_class.__table__.primary_key.name
+        if constraint_name is None:
+            constraint_name = schema_cache.reflect(self.engine, table_class.__tablename__).primary_key.name
+        return constraint_name
+
+    def iter_dataframes(self, statement, categorical_columns: list = None, chunk_size: int = config.FETCH_CHUNK_SIZE):
+        with self.engine.connect() as connection:
+            result = connection.execution_options(stream_results=True, yield_per=chunk_size).execute(statement)
+            columns = list(result.keys())
+            column_types = [getattr(column, 'type', None) for column in getattr(statement, 'selected_columns', [])]
+            column_types = column_types or [None] * len(columns)
+            has_rows = False
+            for partition in result.partitions():
+                has_rows = True
+                yield cast_categorical_columns(build_typed_dataframe(columns, column_types, partition),
+                                               categorical_columns)
+            if not has_rows:
+                yield cast_categorical_columns(build_typed_dataframe(columns, column_types, []), categorical_columns)
+
+    def fetch_dataframe(self, statement, categorical_columns: list = None, chunk_size: int = config.FETCH_CHUNK_SIZE):
+        dataframe = pd.concat(self.iter_dataframes(statement, chunk_size=chunk_size), ignore_index=True)
+        return cast_categorical_columns(dataframe, categorical_columns)
@@ -1,66 +1,80 @@
-from contextlib import contextmanager
-
-import numpy as np
-import pandas as pd
-from sqlalchemy.orm import aliased
-
-from databases.database import Database
-from databases.models import Employee, TempEmployeeManagerMapping
-
-
-@contextmanager
-def database_session(session):
-    try:
-        yield session
-    finally:
-        session.close()
-
-
-class EmployeeDatabase(Database):
-    def __init__(self):
-        super(EmployeeDatabase, self).__init__('emp_collect')
-
-    def get_email_domain_mapping(self):
-        with database_session(self.session) as session:
-            result = session.query(Employee.email_primary_work, Employee.domainaccount).all()
-            return pd.DataFrame(result, columns=['email', 'domain_account'])
-
-    def get_employee_manager_mapping(self):
-        with database_session(self.session) as session:
-            manager = aliased(Employee, name='manager')
-            query = session.query(
-                Employee.email_primary_work.label('employee_email'),
-                Employee.band.label('employee_band'),
-                manager.email_primary_work.label('manager_email'),
-                manager.band.label('manager_band'),
-            ).outerjoin(
-                manager,
-                manager.employee_id == Employee.manager_id
-            )
-            results = pd.DataFrame(query.all())
-            results = results.replace({np.nan: None, pd.NaT: None})
-            results = results.applymap(lambda x: x.strip().lower() if isinstance(x, str) else x)
-            results.drop_duplicates(keep=False)
-            return results
-
-    def get_temp_employee_manager_mapping(self):
-        with database_session(self.session) as session:
-            employee = aliased(TempEmployeeManagerMapping, name='employee')
-            results = session.query(employee.employee_id, employee.worker_name, employee.band,
-                                    employee.termination_date,
-                                    employee.manager_id, employee.manager_legal_name, employee.Manager1ID,
-                                    employee.Manager1Name, employee.Manager2ID, employee.Manager2Name).all()
-            results = pd.DataFrame(results,
-                                   columns=['employee_id', 'employee_name', 'band', 'termination_date', 'manager_id',
-                                            'manager_name', 'lvl1_manager_id', 'lvl1_manager_name', 'lvl2_manager_id',
-                                            'lvl2_manager_name'])
-            results = results.replace({np.nan: None, pd.NaT: None})
-            return results
-
-    def get_employee_id_email_mapping(self):
-        with database_session(self.session) as session:
-            results = session.query(Employee.employee_id, Employee.email_primary_work).all()
-            results = pd.DataFrame(results, columns=['employee_id', 'employee_email'])
-            results = results.replace({np.nan: None, pd.NaT: None})
-            results = results.applymap(lambda x: x.strip().lower() if isinstance(x, str) else x)
-            return results
+from functools import partial
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import aliased
+
+from databases.database import Database
+from databases.models import Employee, TempEmployeeManagerMapping
+from databases.query_cache import employee_query_cache
+from utils.config import config
+
+
+def normalize_string(value):
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+def normalize_strings(dataframe):
+    dataframe = dataframe.copy()
+    for column in dataframe.select_dtypes(include='object').columns:
+        dataframe[column] = dataframe[column].map(normalize_string)
+    return dataframe
+
+
+class EmployeeDatabase(Database):
+    def __init__(self):
+        super(EmployeeDatabase, self).__init__('emp_collect')
+
+    def get_table_fingerprint(self, table_class):
+        primary_key = table_class.__table__.primary_key.columns.values()[0]
+        with self.engine.connect() as connection:
+            row_count, max_key = connection.execute(select(func.count(), func.max(primary_key))).one()
+        return [row_count, None if max_key is None else str(max_key)]
+
+    def fetch_cached(self, key, table_class, fetch):
+        get_fingerprint = None
+        if config.EMPLOYEE_CACHE_PROBE:
+            get_fingerprint = partial(self.get_table_fingerprint, table_class)
+        return employee_query_cache.get_or_fetch(f'{self.database_name}_{key}', fetch, get_fingerprint)
+
+    def get_email_domain_mapping(self):
+        statement = select(Employee.email_primary_work.label('email'), Employee.domainaccount.label('domain_account'))
+        return self.fetch_cached('email_domain_mapping', Employee, lambda: self.fetch_dataframe(statement))
+
+    def get_employee_manager_mapping(self):
+        manager = aliased(Employee, name='manager')
+        statement = select(
+            Employee.email_primary_work.label('employee_email'),
+            Employee.band.label('employee_band'),
+            manager.email_primary_work.label('manager_email'),
+            manager.band.label('manager_band'),
+        ).outerjoin(
+            manager,
+            manager.employee_id == Employee.manager_id
+        )
+        results = self.fetch_cached('employee_manager_mapping', Employee,
+                                    lambda: normalize_strings(self.fetch_dataframe(statement)))
+        results.drop_duplicates(keep=False)
+        return results
+
+    def get_temp_employee_manager_mapping(self):
+        employee = aliased(TempEmployeeManagerMapping, name='employee')
+        statement = select(
+            employee.employee_id.label('employee_id'),
+            employee.worker_name.label('employee_name'),
+            employee.band.label('band'),
+            employee.termination_date.label('termination_date'),
+            employee.manager_id.label('manager_id'),
+            employee.manager_legal_name.label('manager_name'),
+            employee.Manager1ID.label('lvl1_manager_id'),
+            employee.Manager1Name.label('lvl1_manager_name'),
+            employee.Manager2ID.label('lvl2_manager_id'),
+            employee.Manager2Name.label('lvl2_manager_name'),
+        )
+        return self.fetch_cached('temp_employee_manager_mapping', TempEmployeeManagerMapping,
+                                 lambda: self.fetch_dataframe(statement))
+
+    def get_employee_id_email_mapping(self):
+        statement = select(Employee.employee_id.label('employee_id'),
+                           Employee.email_primary_work.label('employee_email'))
+        return self.fetch_cached('employee_id_email_mapping', Employee,
+                                 lambda: normalize_strings(self.fetch_dataframe(statement)))
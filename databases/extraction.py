@@ -0,0 +1,22 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.config import config
+
+
+def timed_query(query):
+    start = time.perf_counter()
+    result = query()
+    return result, time.perf_counter() - start
+
+
+def run_queries(queries: dict, max_workers: int = config.EXTRACTION_WORKERS):
+    start = time.perf_counter()
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(min(max_workers, len(queries)), 1)) as executor:
+        futures = {name: executor.submit(timed_query, query) for name, query in queries.items()}
+        for name, future in futures.items():
+            results[name], seconds = future.result()
+            print(f"Query '{name}' finished in {seconds:.2f}s")
+    print(f"Extracted {len(queries)} queries in {time.perf_counter() - start:.2f}s")
+    return results
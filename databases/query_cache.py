@@ -0,0 +1,58 @@
+import json
+import os
+import time
+from pathlib import Path
+
+from pyarrow import feather
+
+from utils.config import config
+
+
+class QueryCache(object):
+    def __init__(self, path, ttl: int):
+        self.path = Path(path)
+        self.ttl = ttl
+
+    def _get_paths(self, key):
+        return Path(self.path, f'{key}.arrow'), Path(self.path, f'{key}.json')
+
+    def _read_metadata(self, metadata_path):
+        try:
+            with open(metadata_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _is_fresh(self, metadata, fingerprint):
+        if metadata is None or time.time() - metadata['created'] > self.ttl:
+            return False
+        return fingerprint is None or metadata['fingerprint'] == fingerprint
+
+    def _write(self, data_path, metadata_path, dataframe, fingerprint):
+        temp_data_path = data_path.with_suffix(f'.{os.getpid()}.tmp')
+        feather.write_feather(dataframe.reset_index(drop=True), temp_data_path, compression='uncompressed')
+        os.replace(temp_data_path, data_path)
+        temp_metadata_path = metadata_path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(temp_metadata_path, 'w', encoding='utf-8') as file:
+            json.dump({'created': time.time(), 'fingerprint': fingerprint, 'rows': len(dataframe)}, file)
+        os.replace(temp_metadata_path, metadata_path)
+
+    def get_or_fetch(self, key, fetch, get_fingerprint=None):
+        if self.ttl <= 0:
+            return fetch()
+        data_path, metadata_path = self._get_paths(key)
+        fingerprint = get_fingerprint() if get_fingerprint is not None else None
+        if data_path.exists() and self._is_fresh(self._read_metadata(metadata_path), fingerprint):
+            print(f"Reading '{key}' from cache {data_path}")
+            return feather.read_table(data_path, memory_map=True).to_pandas()
+        dataframe = fetch()
+        self._write(data_path, metadata_path, dataframe, fingerprint)
+        return dataframe
+
+    def invalidate(self, key=None):
+        pattern = f'{key}.*' if key is not None else '*'
+        for path in self.path.glob(pattern):
+            path.unlink(missing_ok=True)
+
+
+employee_query_cache = QueryCache(config.CACHE_DIR_PATH, config.EMPLOYEE_CACHE_TTL)
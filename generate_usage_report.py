@@ -1,76 +1,100 @@
-import numpy as np
-import pandas as pd
-
-from databases.asset_database import AssetDatabase
-from databases.employee_database import EmployeeDatabase
-from databases.models import Asset
-from utils.config import config
-from utils.excel_file import ExcelFile
-
-
-def is_match(row):
-    if row['emp_email'] is not None and row['last_use_employee'] is not None:
-        if row['emp_email'] != '' and row['last_use_employee'] != '':
-            if row['emp_email'] == row['last_use_employee']:
-                return True
-            elif row['employee_band'] == '0' and row['emp_email'] == row['manager_email']:
-                return True
-    return False
-
-
-def clean_up_email(row):
-    if pd.notna(row['last_use_employee']):
-        email = row['last_use_employee'].lower()
-        if email.endswith('@thermofisher.com'):
-            if len(email.replace('@thermofisher.com', '')) > 32:
-                return email[32:]
-    return row['last_use_employee']
-
-
-def replace_domain_account(row, mapping_df):
-    if pd.notna(row['last_use_employee']):
-        domain_account = row['last_use_employee'].lower()
-        email = mapping_df[mapping_df['domain_account'].str.lower() == domain_account]['email'].values
-        if email.any():
-            return email[0]
-    return row['last_use_employee']
-
-
-def get_asset_info():
-    asset_info = pd.read_sql_table(Asset.__tablename__, con=AssetDatabase().engine)
-    asset_info = asset_info.drop(['updated_by', 'updated_time'], axis=1)
-    asset_info = asset_info.replace({np.nan: None, pd.NaT: None})
-    asset_info['serial_nu'] = asset_info['serial_nu'].map(lambda x: x.upper() if isinstance(x, str) else x)
-    return asset_info
-
-
-def get_usage_info():
-    asset_db = AssetDatabase()
-    usage_info = asset_db.get_usage_info()
-    employee_db = EmployeeDatabase()
-    email_domain_mapping_df = employee_db.get_email_domain_mapping()
-    usage_info['last_use_employee'] = usage_info.apply(replace_domain_account, axis=1,
-                                                       mapping_df=email_domain_mapping_df)
-    usage_info['last_use_employee'] = usage_info.apply(clean_up_email, axis=1)
-    return usage_info
-
-
-def main():
-    usage_info = get_usage_info()
-    asset_info = get_asset_info()
-    employee_info = EmployeeDatabase().get_employee_manager_mapping()
-
-    result = pd.merge(asset_info, usage_info, on='serial_nu', how='left')
-    employee_info = employee_info.replace({np.nan: None, pd.NaT: None, '': None})
-    employee_info = employee_info[employee_info['employee_email'].notna()]
-    result = pd.merge(result, employee_info, left_on='last_use_employee', right_on='employee_email', how='left')
-    result.drop('employee_email', axis=1, inplace=True)
-    result['is_match'] = result.apply(is_match, axis=1)
-
-    with ExcelFile(config.USAGE_REPORT_FILE_NAME, config.USAGE_REPORT_FILE_PATH) as excel:
-        excel.export_dataframe_to_excel(result, 'usage_info', string_columns=['serial_nu', 'os_version'],
-                                        set_width_by_value=True)
-
-
-if __name__ == '__main__':
-    main()
+import numpy as np
+import pandas as pd
+
+from databases.asset_database import AssetDatabase
+from databases.employee_database import EmployeeDatabase
+from databases.extraction import run_queries
+from utils.config import config
+from utils.excel_file import ExcelFile
+
+
+def is_match(dataframe):
+    emp_email = dataframe['emp_email']
+    last_use_employee = dataframe['last_use_employee']
+    has_emails = emp_email.notna() & last_use_employee.notna() & (emp_email != '') & (last_use_employee != '')
+    matches_manager = (dataframe['employee_band'] == '0') & (emp_email == dataframe['manager_email'])
+    return has_emails & ((emp_email == last_use_employee) | matches_manager)
+
+
+def build_domain_account_lookup(mapping_df):
+    mapping_df = mapping_df[mapping_df['email'].notna() & (mapping_df['email'] != '')]
+    domain_accounts = mapping_df['domain_account'].str.lower()
+    lookup = pd.Series(mapping_df['email'].values, index=domain_accounts)
+    return lookup[lookup.index.notna() & ~lookup.index.duplicated(keep='first')]
+
+
+def replace_domain_account(last_use_employee, lookup):
+    emails = last_use_employee.str.lower().map(lookup)
+    return emails.where(emails.notna(), last_use_employee)
+
+
+def clean_up_email(last_use_employee):
+    emails = last_use_employee.str.lower()
+    domain = '@thermofisher.com'
+    has_long_prefix = emails.str.endswith(domain, na=False) & (emails.str.len() - len(domain) > 32)
+    return last_use_employee.mask(has_long_prefix, emails.str[32:])
+
+
+def get_asset_info():
+    asset_info = AssetDatabase().get_asset_info()
+    asset_info['serial_nu'] = asset_info['serial_nu'].str.upper()
+    return asset_info
+
+
+def get_domain_account_lookup():
+    return build_domain_account_lookup(EmployeeDatabase().get_email_domain_mapping())
+
+
+def clean_up_last_use_employee(usage_info, domain_account_lookup):
+    last_use_employee = replace_domain_account(usage_info['last_use_employee'], domain_account_lookup)
+    usage_info['last_use_employee'] = clean_up_email(last_use_employee)
+    return usage_info
+
+
+def get_employee_info():
+    employee_info = EmployeeDatabase().get_employee_manager_mapping()
+    employee_info = employee_info.replace({np.nan: None, pd.NaT: None, '': None})
+    return employee_info[employee_info['employee_email'].notna()]
+
+
+def add_employee_info(result, employee_info):
+    result = pd.merge(result, employee_info, left_on='last_use_employee', right_on='employee_email', how='left')
+    result.drop('employee_email', axis=1, inplace=True)
+    result['is_match'] = is_match(result)
+    return result
+
+
+def iter_usage_report(domain_account_lookup, employee_info, chunk_size):
+    for chunk in AssetDatabase().iter_asset_usage_info(chunk_size):
+        yield add_employee_info(clean_up_last_use_employee(chunk, domain_account_lookup), employee_info)
+
+
+def main():
+    queries = {
+        'domain_account_lookup': get_domain_account_lookup,
+        'employee_info': get_employee_info,
+    }
+    if not config.USAGE_REPORT_CHUNK_SIZE:
+        queries['usage_info'] = lambda: AssetDatabase().get_usage_info()
+        queries['asset_info'] = get_asset_info
+    extracted = run_queries(queries)
+
+    with ExcelFile(config.USAGE_REPORT_FILE_NAME, config.USAGE_REPORT_FILE_PATH,
+                   constant_memory=config.USAGE_REPORT_CONSTANT_MEMORY) as excel:
+        if config.USAGE_REPORT_CHUNK_SIZE:
+            chunks = iter_usage_report(extracted['domain_account_lookup'], extracted['employee_info'],
+                                       config.USAGE_REPORT_CHUNK_SIZE)
+            rows = excel.export_dataframe_chunks_to_excel(chunks, 'usage_info',
+                                                          string_columns=['serial_nu', 'os_version'],
+                                                          set_width_by_value=True)
+            print(f"Wrote {rows} rows to the usage report in chunks of {config.USAGE_REPORT_CHUNK_SIZE}")
+        else:
+            usage_info = clean_up_last_use_employee(extracted['usage_info'], extracted['domain_account_lookup'])
+            result = pd.merge(extracted['asset_info'], usage_info, on='serial_nu', how='left')
+            result = add_employee_info(result, extracted['employee_info'])
+            excel.export_dataframe_to_excel(result, 'usage_info', string_columns=['serial_nu', 'os_version'],
+                                            set_width_by_value=True)
+
+
+if __name__ == '__main__':
+    main()
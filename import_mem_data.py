@@ -1,50 +1,74 @@
-import datetime
-import os
-import zipfile
-
-import pandas as pd
-import pytz
-
-from databases.asset_database import AssetDatabase
-from databases.models import DeviceUsage
-from utils.config import config
-
-
-def convert_utc_to_shanghai(dataframe, column_name):
-    def convert(row):
-        try:
-            timestamp = pd.to_datetime(row[column_name], format='%Y-%m-%d %H:%M:%S.%f')
-            timestamp = timestamp.tz_localize('UTC')
-            shanghai_tz = pytz.timezone('Asia/Shanghai')
-            return timestamp.tz_convert(shanghai_tz)
-        except pd.errors.OutOfBoundsDatetime:
-            return None
-
-    dataframe[column_name] = dataframe.apply(convert, axis=1)
-    return dataframe
-
-
-def main():
-    zip_file = [file for file in os.listdir(config.BROWSER_DOWNLOAD_DIR_PATH) if file.endswith('.zip')]
-    if not zip_file:
-        raise FileNotFoundError('No mem report zip file found')
-    zip_file_path = os.path.join(config.BROWSER_DOWNLOAD_DIR_PATH, zip_file[0])
-    csv_file_name = f'mem_{datetime.datetime.utcnow().strftime("%Y%m%d%H%M%S")}.csv'
-    with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-        zip_csv_file = [file for file in zip_ref.namelist() if file.endswith('.csv')]
-        if zip_csv_file:
-            zip_csv_file = zip_csv_file[0]
-            zip_ref.getinfo(zip_csv_file).filename = csv_file_name
-            zip_ref.extract(zip_csv_file, path=config.BROWSER_DOWNLOAD_DIR_PATH)
-    csv_file_path = os.path.join(config.BROWSER_DOWNLOAD_DIR_PATH, csv_file_name)
-    os.remove(zip_file_path)
-
-    df = pd.read_csv(csv_file_path)
-    df = convert_utc_to_shanghai(df, 'Last check-in')
-    asset_db = AssetDatabase()
-    asset_db.create_table_if_not_exists(DeviceUsage)
-    asset_db.update_or_insert_device_usage_data(DeviceUsage, df)
-
-
-if __name__ == '__main__':
-    main()
+import datetime
+import os
+import zipfile
+
+import pandas as pd
+
+from databases.asset_database import AssetDatabase, DEVICE_USAGE_COLUMN_MAPPING
+from databases.models import DeviceUsage
+from utils.config import config
+from utils.snapshot import open_snapshot
+from utils.timestamps import SHANGHAI_TIMEZONE, normalize_timestamp_columns
+from utils.utils import get_rejects_file_path
+
+
+def convert_utc_to_shanghai(dataframe, column_name):
+    return normalize_timestamp_columns(dataframe, [column_name], 'UTC', SHANGHAI_TIMEZONE)
+
+
+def find_zip_csv_member(zip_ref):
+    zip_csv_files = [file for file in zip_ref.namelist() if file.endswith('.csv')]
+    if not zip_csv_files:
+        raise FileNotFoundError('No csv file found in the mem report zip file')
+    return zip_csv_files[0]
+
+
+def read_csv_chunks(zip_ref, csv_member, chunk_size, columns: list = None):
+    with zip_ref.open(csv_member) as csv_file:
+        for chunk in pd.read_csv(csv_file, encoding='utf-8-sig', chunksize=chunk_size,
+                                 dtype={label: str for label in DEVICE_USAGE_COLUMN_MAPPING},
+                                 usecols=lambda label: label in (columns or DEVICE_USAGE_COLUMN_MAPPING)):
+            yield chunk
+
+
+def get_duplicate_device_ids(zip_ref, csv_member, chunk_size):
+    device_ids = pd.concat(chunk['Device ID'] for chunk in read_csv_chunks(zip_ref, csv_member, chunk_size,
+                                                                             ['Device ID']))
+    return set(device_ids[device_ids.duplicated(keep=False) & device_ids.notna()])
+
+
+def import_device_usage_data(zip_file_path, database, chunk_size=config.MEM_CSV_CHUNK_SIZE):
+    csv_file_path = os.path.join(config.BROWSER_DOWNLOAD_DIR_PATH,
+                                 f'mem_{datetime.datetime.utcnow().strftime("%Y%m%d%H%M%S")}.csv')
+    rejects_file = get_rejects_file_path(csv_file_path)
+    database.create_table_if_not_exists(DeviceUsage)
+    counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+    with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
+        csv_member = find_zip_csv_member(zip_ref)
+        duplicate_device_ids = get_duplicate_device_ids(zip_ref, csv_member, chunk_size)
+        with open_snapshot(DeviceUsage.__tablename__, f'{zip_file_path}:{csv_member}') as snapshot:
+            for chunk in read_csv_chunks(zip_ref, csv_member, chunk_size):
+                chunk = convert_utc_to_shanghai(chunk, 'Last check-in')
+                chunk_counts = database.update_or_insert_device_usage_data(
+                    DeviceUsage, chunk, rejects_file, snapshot, duplicate_device_ids, append_rejects=True)
+                for key, value in chunk_counts.items():
+                    counts[key] += value
+    print(f"Imported '{csv_member}': {counts['inserted']} inserted, {counts['updated']} updated, "
+          f"{counts['unchanged']} unchanged")
+    return counts
+
+
+def main():
+    zip_file = [file for file in os.listdir(config.BROWSER_DOWNLOAD_DIR_PATH) if file.endswith('.zip')]
+    if not zip_file:
+        raise FileNotFoundError('No mem report zip file found')
+    zip_file_path = os.path.join(config.BROWSER_DOWNLOAD_DIR_PATH, zip_file[0])
+    asset_db = AssetDatabase()
+    import_device_usage_data(zip_file_path, asset_db)
+    os.remove(zip_file_path)
+    if config.USAGE_INFO_MATERIALIZED_VIEW:
+        asset_db.refresh_usage_info_view()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,55 +1,62 @@
-import json
-from pathlib import Path
-
-import openpyxl
-import pandas as pd
-
-from databases.asset_database import AssetDatabase
-from databases.models import Computer, ComputerSysMappingTable
-from utils.config import config
-
-
-def import_computer_sys_mapping_data(file, database):
-    with open(file, 'r', encoding='UTF-8') as file:
-        json_data = json.load(file)
-    new_json_data = {'records': []}
-    for record in json_data['records']:
-        new_record = {
-            'serial_number': record['serial_number'],
-            'sys_id': record['sys_id']
-        }
-        new_json_data['records'].append(new_record)
-    database.create_table_if_not_exists(ComputerSysMappingTable)
-    database.update_or_insert_sn_asset_sys_mapping_data(ComputerSysMappingTable, pd.DataFrame(new_json_data['records']))
-
-
-def get_visible_sheet_name(excel_file):
-    sheets = openpyxl.load_workbook(excel_file, read_only=True).worksheets
-    visible_sheets = []
-    for sheet in sheets:
-        if sheet.sheet_state != 'hidden':
-            visible_sheets.append(sheet.title)
-    if len(visible_sheets) != 1:
-        raise Exception(f'{excel_file}: the excel file should contain only one visible sheet')
-    return visible_sheets[0]
-
-
-def import_computer_data(file, database):
-    excel_file = pd.ExcelFile(file)
-    visible_sheet_name = get_visible_sheet_name(excel_file)
-    df = pd.read_excel(excel_file, sheet_name=visible_sheet_name)
-    database.create_table_if_not_exists(Computer)
-    database.update_or_insert_sn_asset_data(Computer, df)
-
-
-def main():
-    report_folder_path = config.BROWSER_DOWNLOAD_DIR_PATH
-    asset_db = AssetDatabase()
-    excel_file = Path(report_folder_path, 'cmdb_ci_computer.xlsx')
-    import_computer_data(excel_file, asset_db)
-    json_file = Path(report_folder_path, 'cmdb_ci_computer.json')
-    import_computer_sys_mapping_data(json_file, asset_db)
-
-
-if __name__ == '__main__':
-    main()
+from collections import Counter
+from pathlib import Path
+
+import pandas as pd
+
+from databases.asset_database import AssetDatabase, COMPUTER_COLUMN_MAPPING, get_column_types
+from databases.models import Computer, ComputerSysMappingTable
+from utils.config import config
+from utils.json_reader import iter_json_column_batches
+from utils.snapshot import open_snapshot
+from utils.utils import get_rejects_file_path
+from utils.xlsx_reader import read_xlsx
+
+
+def find_duplicate_sys_ids(file, batch_size):
+    sys_id_counts = Counter()
+    for batch in iter_json_column_batches(file, ['sys_id'], batch_size):
+        sys_id_counts.update(sys_id for sys_id in batch['sys_id'] if sys_id is not None)
+    return {sys_id for sys_id, count in sys_id_counts.items() if count > 1}
+
+
+def import_computer_sys_mapping_data(file, database, batch_size=config.SYS_MAPPING_BATCH_SIZE):
+    columns = ['serial_number', 'sys_id']
+    duplicate_sys_ids = find_duplicate_sys_ids(file, batch_size)
+    rejects_file = get_rejects_file_path(file)
+    if rejects_file is not None:
+        rejects_file.unlink(missing_ok=True)
+    database.create_table_if_not_exists(ComputerSysMappingTable)
+    counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+    with open_snapshot(ComputerSysMappingTable.__tablename__, file) as snapshot:
+        start = 0
+        for batch in iter_json_column_batches(file, columns, batch_size):
+            df = pd.DataFrame(batch, columns=columns)
+            df.index += start
+            start += len(df)
+            chunk_counts = database.update_or_insert_sn_asset_sys_mapping_data(
+                ComputerSysMappingTable, df, rejects_file, snapshot, duplicate_sys_ids, append_rejects=True)
+            for key, value in chunk_counts.items():
+                counts[key] += value
+    return counts
+
+
+def import_computer_data(file, database):
+    df = read_xlsx(file, get_column_types(Computer, COMPUTER_COLUMN_MAPPING))
+    database.create_table_if_not_exists(Computer)
+    with open_snapshot(Computer.__tablename__, file) as snapshot:
+        database.update_or_insert_sn_asset_data(Computer, df, get_rejects_file_path(file), snapshot)
+
+
+def main():
+    report_folder_path = config.BROWSER_DOWNLOAD_DIR_PATH
+    asset_db = AssetDatabase()
+    excel_file = Path(report_folder_path, 'cmdb_ci_computer.xlsx')
+    import_computer_data(excel_file, asset_db)
+    json_file = Path(report_folder_path, 'cmdb_ci_computer.json')
+    import_computer_sys_mapping_data(json_file, asset_db)
+    if config.USAGE_INFO_MATERIALIZED_VIEW:
+        asset_db.refresh_usage_info_view()
+
+
+if __name__ == '__main__':
+    main()
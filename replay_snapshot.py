@@ -0,0 +1,56 @@
+import argparse
+
+from databases.asset_database import AssetDatabase
+from databases.models import Asset, Computer, ComputerSysMappingTable, DeviceUsage
+from utils.config import config
+from utils.diff import get_table_column_types
+from utils.snapshot import diff_snapshots, list_snapshot_days, load_snapshot
+
+SNAPSHOT_TABLES = {table_class.__tablename__: table_class
+                   for table_class in [Computer, ComputerSysMappingTable, Asset, DeviceUsage]}
+
+
+def replay_snapshot(database, table_class, day=None):
+    df = load_snapshot(table_class.__tablename__, day)
+    if df is None:
+        raise FileNotFoundError(f"No snapshot of '{table_class.__tablename__}' found for {day or 'any day'}")
+    df = df.astype(object).where(df.notna(), None)
+    database.create_table_if_not_exists(table_class)
+    return database.update_or_insert_data(table_class, df, ignore_fields=['updated_time'])
+
+
+def print_snapshot_diff(table_class, day=None):
+    pk_column_name = table_class.__table__.primary_key.columns.values()[0].name
+    diff = diff_snapshots(table_class.__tablename__, pk_column_name, day,
+                          column_types=get_table_column_types(table_class))
+    if diff is None:
+        print(f"Need two snapshots of '{table_class.__tablename__}' to diff, found "
+              f"{list_snapshot_days(table_class.__tablename__)}")
+        return
+    print(f"'{table_class.__tablename__}': {len(diff.added)} added, {len(diff.deleted)} deleted, "
+          f"{len(diff.changed)} changed")
+    changed_column_counts = diff.changed_columns.sum()
+    changed_column_counts = changed_column_counts[changed_column_counts > 0].sort_values(ascending=False)
+    if not changed_column_counts.empty:
+        print(changed_column_counts.to_string())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay or diff import snapshots')
+    parser.add_argument('table', choices=sorted(SNAPSHOT_TABLES))
+    parser.add_argument('--day', help='snapshot day as YYYYMMDD, defaults to the latest')
+    parser.add_argument('--diff', action='store_true', help='diff against the previous snapshot instead of replaying')
+    args = parser.parse_args()
+
+    table_class = SNAPSHOT_TABLES[args.table]
+    if args.diff:
+        print_snapshot_diff(table_class, args.day)
+        return
+    asset_db = AssetDatabase()
+    replay_snapshot(asset_db, table_class, args.day)
+    if config.USAGE_INFO_MATERIALIZED_VIEW:
+        asset_db.refresh_usage_info_view()
+
+
+if __name__ == '__main__':
+    main()
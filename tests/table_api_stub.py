@@ -0,0 +1,57 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+def make_handler(records, latency=0.0, send_total_count=True):
+    class TableApiHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        requests = []
+
+        def do_GET(self):
+            params = parse_qs(urlparse(self.path).query)
+            if self.headers.get('Authorization') is None:
+                self.send_response(401)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            offset = int(params.get('sysparm_offset', ['0'])[0])
+            limit = int(params.get('sysparm_limit', ['10000'])[0])
+            fields = params['sysparm_fields'][0].split(',')
+            self.requests.append((offset, limit))
+            time.sleep(latency)
+            body = json.dumps({'result': [{field: record[field] for field in fields if field in record}
+                                          for record in records[offset:offset + limit]]}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            if send_total_count:
+                self.send_header('X-Total-Count', str(len(records)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return TableApiHandler
+
+
+class TableApiStub(object):
+    def __init__(self, records, latency=0.0, send_total_count=True):
+        self.handler = make_handler(records, latency, send_total_count)
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self.handler)
+        self.base_url = f'http://127.0.0.1:{self.server.server_port}'
+
+    @property
+    def requests(self):
+        return self.handler.requests
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.server.shutdown()
+        self.server.server_close()
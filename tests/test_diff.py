@@ -0,0 +1,23 @@
+import pandas as pd
+from sqlalchemy import Integer, String, TIMESTAMP
+
+from utils.diff import diff_dataframes
+
+
+def test_unchanged_rows_are_not_reported_when_sides_infer_different_dtypes():
+    origin = pd.DataFrame({'employee_id': ['1', '2'], 'termination_date': [None, None], 'band': [1, None]})
+    updated = pd.DataFrame({'employee_id': ['1', '2'], 'termination_date': pd.to_datetime([None, None]),
+                            'band': pd.array([1, None], dtype='Int64')})
+    diff = diff_dataframes(origin, updated, 'employee_id')
+    assert list(diff.changed) == []
+
+
+def test_model_types_drive_the_comparison():
+    origin = pd.DataFrame({'employee_id': ['1', '2'], 'band': [5, None],
+                           'termination_date': [pd.Timestamp('2024-01-01'), None]})
+    updated = pd.DataFrame({'employee_id': ['1', '2'], 'band': ['5', None],
+                            'termination_date': ['2024-01-01 00:00:00', '2024-02-01']})
+    column_types = {'band': Integer(), 'termination_date': TIMESTAMP(), 'employee_id': String()}
+    diff = diff_dataframes(origin, updated, 'employee_id', column_types=column_types)
+    assert list(diff.changed) == ['2']
+    assert diff.changed_columns.loc['2'].to_dict() == {'band': False, 'termination_date': True}
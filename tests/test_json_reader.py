@@ -0,0 +1,30 @@
+import json
+
+import pytest
+
+from utils.json_reader import iter_json_column_batches, read_json_columns
+
+RECORDS = [{'sys_id': f'{i:032x}', 'serial_number': f'SN{i:04d}', 'name': f'PC-{i}'} for i in range(7)]
+RECORDS[3]['serial_number'] = None
+del RECORDS[5]['serial_number']
+
+
+@pytest.fixture
+def export_file(tmp_path):
+    path = tmp_path / 'cmdb_ci_computer.json'
+    path.write_text(json.dumps({'records': RECORDS}))
+    return path
+
+
+@pytest.mark.parametrize('engine', ['ijson', 'memory'])
+def test_batches_cover_every_record_in_order(export_file, engine):
+    batches = list(iter_json_column_batches(export_file, ['sys_id', 'serial_number'], 3, engine=engine))
+    assert [len(batch['sys_id']) for batch in batches] == [3, 3, 1]
+    assert sum((batch['sys_id'] for batch in batches), []) == [record['sys_id'] for record in RECORDS]
+    assert sum((batch['serial_number'] for batch in batches), []) == [record.get('serial_number')
+                                                                      for record in RECORDS]
+
+
+def test_auto_engine_reads_the_same_columns_as_memory(export_file):
+    assert read_json_columns(export_file, ['sys_id', 'serial_number'], engine='auto') == \
+        read_json_columns(export_file, ['sys_id', 'serial_number'], engine='memory')
@@ -0,0 +1,32 @@
+import pandas as pd
+
+from databases.asset_database import get_row_hashes
+from databases.models import Computer
+
+
+def make_row(**values):
+    row = {'serial_number': 'SN0001', 'name': 'PC-0001', 'employee_id': 123456, 'active': True,
+           'last_login_time': pd.Timestamp('2024-01-02 03:04:05')}
+    row.update(values)
+    return row
+
+
+def test_row_hashes_the_same_alone_and_inside_a_mixed_frame():
+    alone = pd.DataFrame([make_row()])
+    mixed = pd.DataFrame([make_row(serial_number='SN0002', employee_id=None, active=None, last_login_time=None),
+                          make_row(),
+                          make_row(serial_number='SN0003', last_login_time='not a date', employee_id='654321')])
+    assert get_row_hashes(Computer, alone)[0] == get_row_hashes(Computer, mixed)[1]
+
+
+def test_row_hash_ignores_int_float_and_null_representations():
+    as_float = pd.DataFrame([make_row(employee_id=123456.0), make_row(serial_number='SN0002', employee_id=float('nan'),
+                                                                      last_login_time=pd.NaT)])
+    as_object = pd.DataFrame([make_row(employee_id='123456'), make_row(serial_number='SN0002', employee_id=None,
+                                                                       last_login_time=None)]).astype(object)
+    assert list(get_row_hashes(Computer, as_float)) == list(get_row_hashes(Computer, as_object))
+
+
+def test_row_hash_changes_with_the_row():
+    hashes = get_row_hashes(Computer, pd.DataFrame([make_row(), make_row(name='PC-0002')]))
+    assert hashes[0] != hashes[1]
@@ -0,0 +1,90 @@
+import pytest
+
+from utils.config import config
+from utils.json_reader import read_json_columns
+from tests.table_api_stub import TableApiStub
+from utils.servicenow_api import ServiceNowTableClient, export_sn_report, export_sn_report_via_api
+
+PAGE_SIZE = 5
+
+FIELDS = [['name', 'Name'], ['manufacturer', 'Manufacturer'], ['sys_class_name', 'Class'],
+          ['serial_number', 'Serial number'], ['os', 'Operating System'], ['os_version', 'OS Version'],
+          ['u_city', 'City'], ['u_user_id', 'User ID'], ['u_active', 'Active'], ['u_vip', 'VIP'],
+          ['u_title', 'Title'], ['u_last_login_time', 'Last login time'], ['u_mobile_phone', 'Mobile phone'],
+          ['u_employee_id', 'Employee ID'], ['u_business_unit', 'Business Unit'], ['virtual', 'Is Virtual'],
+          ['u_is_deleted', 'Is deleted'], ['last_discovered', 'Most recent discovery'],
+          ['u_last_logged_user', 'Last Logged User'], ['u_last_logged_in_user', 'Last logged in user'],
+          ['location', 'Location'], ['location.city', 'City'], ['location.u_site_code', 'Site Code ']]
+
+
+@pytest.fixture
+def table_api():
+    opened = []
+
+    def start(records, send_total_count=True):
+        stub = TableApiStub(records, send_total_count=send_total_count).__enter__()
+        client = ServiceNowTableClient(stub.base_url, ('user', 'password'), page_size=PAGE_SIZE, workers=3)
+        opened.extend([client, stub])
+        return client, stub
+
+    yield start
+    for context in reversed(opened):
+        context.__exit__(None, None, None)
+
+
+def make_record(number=1, **values):
+    record = {field: '' for field, _ in FIELDS}
+    record.update({'sys_id': f'{number:032x}', 'serial_number': f'SN{number:04d}'}, **values)
+    return record
+
+
+def make_records(count):
+    return [make_record(number) for number in range(1, count + 1)]
+
+
+def test_export_writes_the_importer_files(table_api, tmp_path):
+    client, _ = table_api([make_record()])
+    excel_file, json_file = export_sn_report(client, FIELDS, tmp_path)
+    assert excel_file.exists()
+    assert read_json_columns(json_file, ['sys_id', 'serial_number']) == {'sys_id': [f'{1:032x}'],
+                                                                         'serial_number': ['SN0001']}
+
+
+def test_pages_are_fetched_in_parallel_and_kept_in_order(table_api, tmp_path):
+    records = make_records(23)
+    client, stub = table_api(records)
+    _, json_file = export_sn_report(client, FIELDS, tmp_path)
+    assert read_json_columns(json_file, ['serial_number'])['serial_number'] == [r['serial_number'] for r in records]
+    assert sorted(stub.requests) == [(offset, PAGE_SIZE) for offset in range(0, 23, PAGE_SIZE)]
+
+
+@pytest.mark.parametrize('count', [23, 20])
+def test_missing_total_count_falls_back_to_sequential_pages(table_api, count):
+    records = make_records(count)
+    client, stub = table_api(records, send_total_count=False)
+    fetched = client.get_records('cmdb_ci_computer', ['sys_id', 'serial_number'])
+    assert fetched == [{'sys_id': r['sys_id'], 'serial_number': r['serial_number']} for r in records]
+    assert [offset for offset, _ in stub.requests] == list(range(0, count + 1, PAGE_SIZE))
+
+
+def test_dropped_fields_fail_loudly(table_api, tmp_path):
+    records = make_records(7)
+    for record in records:
+        del record['u_vip']
+    client, _ = table_api(records)
+    with pytest.raises(ValueError, match='u_vip'):
+        export_sn_report(client, FIELDS, tmp_path)
+    assert not list(tmp_path.iterdir())
+
+
+def test_fields_must_cover_the_importer_columns(table_api, tmp_path):
+    client, stub = table_api([make_record()])
+    with pytest.raises(ValueError, match='Site Code'):
+        export_sn_report(client, FIELDS[:-1], tmp_path)
+    assert not stub.requests
+
+
+def test_api_mode_requires_configured_fields(monkeypatch):
+    monkeypatch.setattr(config, 'SN_API_FIELDS', None)
+    with pytest.raises(ValueError, match='SN_API_FIELDS'):
+        export_sn_report_via_api()
@@ -0,0 +1,40 @@
+import datetime
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from utils import snapshot
+from utils.config import config
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'SNAPSHOT_DIR_PATH', tmp_path)
+    monkeypatch.setattr(config, 'SNAPSHOT_RETENTION_DAYS', 0)
+    return tmp_path
+
+
+def test_half_written_snapshot_is_not_listed(snapshot_dir):
+    with snapshot.SnapshotWriter('computer', day=datetime.datetime(2024, 1, 1)) as writer:
+        writer.write(pd.DataFrame({'serial_number': ['SN1']}))
+    temp_path = Path(snapshot_dir, 'computer', '20240101.1234.tmp')
+    temp_path.mkdir()
+    Path(temp_path, snapshot.MANIFEST_FILE_NAME).write_text(json.dumps({'parts': []}))
+    assert snapshot.list_snapshot_days('computer') == ['20240101']
+    assert snapshot.load_snapshot('computer')['serial_number'].tolist() == ['SN1']
+
+
+def test_parts_with_different_column_types_are_loaded(snapshot_dir):
+    with snapshot.SnapshotWriter('device_usage', day=datetime.datetime(2024, 1, 1)) as writer:
+        writer.write(pd.DataFrame({'device_id': ['a'], 'count': [1], 'value': [1],
+                                   'seen': [pd.Timestamp('2024-01-01')]}))
+        writer.write(pd.DataFrame({'device_id': ['b'], 'count': [1.5], 'value': ['x'],
+                                   'seen': [pd.Timestamp('2024-01-01', tz='Asia/Shanghai')]}))
+        writer.write(pd.DataFrame({'device_id': ['c'], 'count': [None]}))
+    dataframe = snapshot.load_snapshot('device_usage')
+    assert dataframe['device_id'].tolist() == ['a', 'b', 'c']
+    assert dataframe['count'].tolist()[:2] == [1.0, 1.5]
+    assert dataframe['value'].tolist()[:2] == ['1', 'x']
+    assert dataframe['seen'].dt.tz is not None
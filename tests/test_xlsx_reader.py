@@ -0,0 +1,55 @@
+import datetime
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from databases.asset_database import COMPUTER_COLUMN_MAPPING, get_column_types
+from databases.models import Computer
+from utils import xlsx_reader
+
+HEADER = ['Name', 'Serial number', 'Employee ID', 'Last login time', 'City', 'City']
+ROWS = [
+    ['PC-1', 'SN0001', 123456, datetime.datetime(2024, 1, 2, 3, 4, 5), 'Shanghai', None],
+    ['PC-2', 12345, 'n/a', 'not a date', None, 'Beijing'],
+    ['PC-3', 'SN0003', 654321.0, '2024-02-03 04:05:06', 'Suzhou', 'Suzhou'],
+]
+
+
+@pytest.fixture
+def export_file(tmp_path):
+    path = tmp_path / 'cmdb_ci_computer.xlsx'
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = 'Page 1'
+    sheet.append(HEADER)
+    for row in ROWS:
+        sheet.append(row)
+    hidden = workbook.create_sheet('Hidden')
+    hidden.sheet_state = 'hidden'
+    workbook.save(path)
+    return path
+
+
+@pytest.mark.parametrize('engine', ['openpyxl', 'calamine'])
+def test_read_xlsx_types_and_coerces_invalid_cells(export_file, engine, capsys):
+    if engine == 'calamine':
+        pytest.importorskip('python_calamine')
+    dataframe = xlsx_reader.read_xlsx(export_file, get_column_types(Computer, COMPUTER_COLUMN_MAPPING), engine=engine)
+    assert list(dataframe.columns) == ['Name', 'Serial number', 'Employee ID', 'Last login time', 'City', 'City.1']
+    assert dataframe['Serial number'].tolist() == ['SN0001', '12345', 'SN0003']
+    assert dataframe['Employee ID'].tolist() == [123456, pd.NA, 654321]
+    assert dataframe['Last login time'].tolist()[0] == pd.Timestamp('2024-01-02 03:04:05')
+    assert pd.isna(dataframe['Last login time'][1])
+    assert dataframe['Last login time'][2] == pd.Timestamp('2024-02-03 04:05:06')
+    assert dataframe['City.1'].tolist() == [None, 'Beijing', 'Suzhou']
+    output = capsys.readouterr().out
+    assert "Coerced 1 invalid values in 'Employee ID' to null" in output
+    assert "Coerced 1 invalid values in 'Last login time' to null" in output
+
+
+def test_calamine_and_openpyxl_engines_agree(export_file):
+    pytest.importorskip('python_calamine')
+    column_types = get_column_types(Computer, COMPUTER_COLUMN_MAPPING)
+    pd.testing.assert_frame_equal(xlsx_reader.read_xlsx(export_file, column_types, engine='calamine'),
+                                  xlsx_reader.read_xlsx(export_file, column_types, engine='openpyxl'))
@@ -1,73 +1,108 @@
-import datetime
-import json
-import os
-import sys
-from pathlib import Path
-
-from decouple import config as decouple_config
-
-
-def set_columns_as_str(columns, dtype=str):
-    columns_list = columns.split(',') if columns else []
-    dtype_dict = {}
-    if columns_list:
-        for column in columns_list:
-            dtype_dict[column] = dtype
-    return dtype_dict
-
-
-class Config(object):
-    allure_results_dir = decouple_config('ALLURE_RESULTS_DIR', default='allure-results', cast=lambda x: x.split(','))
-    logs_dir = decouple_config('LOGS_DIR', default='logs', cast=lambda x: x.split(','))
-    screenshots_dir = decouple_config('SCREENSHOTS_DIR', default='screenshots', cast=lambda x: x.split(','))
-    browser_download_dir = decouple_config('BROWSER_DOWNLOAD_DIR', default='download', cast=lambda x: x.split(','))
-    export_report_dir = decouple_config('EXPORT_REPORT_DIR', default='export', cast=lambda x: x.split(','))
-    import_report_dir = decouple_config('IMPORT_REPORT_DIR', default='import', cast=lambda x: x.split(','))
-    root_path = Path('/', 'tmp', 'report-export-import')
-
-    ALLURE_RESULTS_DIR_PATH = Path(root_path, *allure_results_dir).resolve()
-    logs_dir_path = Path(root_path, *logs_dir).resolve()
-    SCREENSHOTS_DIR_PATH = Path(root_path, *screenshots_dir).resolve()
-    BROWSER_DOWNLOAD_DIR_PATH = Path(root_path, *browser_download_dir).resolve()
-    export_report_dir_path = Path(root_path, *export_report_dir).resolve()
-    import_report_dir_path = Path(root_path, *import_report_dir).resolve()
-    for path in [ALLURE_RESULTS_DIR_PATH, logs_dir_path, SCREENSHOTS_DIR_PATH, BROWSER_DOWNLOAD_DIR_PATH,
-                 export_report_dir_path, import_report_dir_path]:
-        if not os.path.exists(path):
-            os.makedirs(path)
-
-    LOG_FILE_PATH = Path(logs_dir_path, decouple_config('LOG_FILE', default='steps.log'))
-    PYTHON_VERSION = f'{sys.version_info.major}.{sys.version_info.minor}'
-    JOB_LIST = decouple_config('JOB_LIST', default=[], cast=json.loads)
-    JOB_RERUNS = decouple_config('JOB_RERUNS', default=0, cast=int)
-    JOB_RERUNS_DELAY = decouple_config('JOB_RERUNS_DELAY', default=0, cast=int)
-    BROWSER_LIST = decouple_config('BROWSER_LIST', default='chrome,edge,firefox', cast=lambda x: x.split(','))
-    BROWSER_HEADLESS_MODE = decouple_config('BROWSER_HEADLESS_MODE', default=True, cast=bool)
-    BROWSER_TIMEOUT = decouple_config('BROWSER_TIMEOUT', default=140, cast=int)
-    SLEEP_TIME_UPPER_LIMIT_RANGE = decouple_config('SLEEP_TIME_UPPER_LIMIT_RANGE', default='60,120',
-                                                   cast=lambda x: tuple(int(val) for val in x.split(',')))
-    USERS = decouple_config('USERS', cast=lambda x: json.loads(x))
-
-    ASSET_REPORT_FILE_PATH = Path(import_report_dir_path, decouple_config('ASSET_REPORT'))
-    ASSET_REPORT_SHEET = decouple_config('ASSET_REPORT_SHEET')
-
-    USAGE_REPORT_FILE_NAME = decouple_config('USAGE_REPORT_FILE_NAME', default='usage_report.xlsx')
-    USAGE_REPORT_FILE_PATH = Path(export_report_dir_path, USAGE_REPORT_FILE_NAME)
-
-    CST_NOW = datetime.datetime.now(tz=datetime.timezone(datetime.timedelta(hours=8)))
-    cst_now_str = CST_NOW.strftime('%Y%m%d')
-    TEMP_EMPLOYEE_REPORT_FILE_NAME = decouple_config('TEMP_EMPLOYEE_REPORT_FILE_NAME',
-                                                     default=f'temp_employee_report_{cst_now_str}.xlsx')
-    TEMP_EMPLOYEE_REPORT_FILE_PATH = Path(export_report_dir_path, TEMP_EMPLOYEE_REPORT_FILE_NAME)
-
-    SMTP_SERVER = decouple_config('SMTP_SERVER')
-    SMTP_PORT = decouple_config('SMTP_PORT', cast=int, default=25)
-    TEMP_EMPLOYEE_EMAIL_FROM = decouple_config('TEMP_EMPLOYEE_EMAIL_FROM')
-    TEMP_EMPLOYEE_EMAIL_TO = decouple_config('TEMP_EMPLOYEE_EMAIL_TO', cast=lambda x: x.split(','))
-    TEMP_EMPLOYEE_EMAIL_BCC = decouple_config('TEMP_EMPLOYEE_EMAIL_BCC', cast=lambda x: x.split(','))
-    TEMP_EMPLOYEE_EMAIL_SUBJECT = decouple_config('TEMP_EMPLOYEE_EMAIL_SUBJECT',
-                                                  default=f'{cst_now_str} Temporary Employee Data')
-    TEMP_EMPLOYEE_EMAIL_IT_SUPPORT_MAILBOX = decouple_config('TEMP_EMPLOYEE_EMAIL_IT_SUPPORT_MAILBOX')
-
-
-config = Config()
+import datetime
+import json
+import os
+import sys
+from pathlib import Path
+
+from decouple import config as decouple_config
+
+
+def set_columns_as_str(columns, dtype=str):
+    columns_list = columns.split(',') if columns else []
+    dtype_dict = {}
+    if columns_list:
+        for column in columns_list:
+            dtype_dict[column] = dtype
+    return dtype_dict
+
+
+class Config(object):
+    allure_results_dir = decouple_config('ALLURE_RESULTS_DIR', default='allure-results', cast=lambda x: x.split(','))
+    logs_dir = decouple_config('LOGS_DIR', default='logs', cast=lambda x: x.split(','))
+    screenshots_dir = decouple_config('SCREENSHOTS_DIR', default='screenshots', cast=lambda x: x.split(','))
+    browser_download_dir = decouple_config('BROWSER_DOWNLOAD_DIR', default='download', cast=lambda x: x.split(','))
+    export_report_dir = decouple_config('EXPORT_REPORT_DIR', default='export', cast=lambda x: x.split(','))
+    import_report_dir = decouple_config('IMPORT_REPORT_DIR', default='import', cast=lambda x: x.split(','))
+    cache_dir = decouple_config('CACHE_DIR', default='cache', cast=lambda x: x.split(','))
+    snapshot_dir = decouple_config('SNAPSHOT_DIR', default='snapshots', cast=lambda x: x.split(','))
+    root_path = Path('/', 'tmp', 'report-export-import')
+
+    ALLURE_RESULTS_DIR_PATH = Path(root_path, *allure_results_dir).resolve()
+    logs_dir_path = Path(root_path, *logs_dir).resolve()
+    SCREENSHOTS_DIR_PATH = Path(root_path, *screenshots_dir).resolve()
+    BROWSER_DOWNLOAD_DIR_PATH = Path(root_path, *browser_download_dir).resolve()
+    export_report_dir_path = Path(root_path, *export_report_dir).resolve()
+    import_report_dir_path = Path(root_path, *import_report_dir).resolve()
+    CACHE_DIR_PATH = Path(root_path, *cache_dir).resolve()
+    SNAPSHOT_DIR_PATH = Path(root_path, *snapshot_dir).resolve()
+    for path in [ALLURE_RESULTS_DIR_PATH, logs_dir_path, SCREENSHOTS_DIR_PATH, BROWSER_DOWNLOAD_DIR_PATH,
+                 export_report_dir_path, import_report_dir_path, CACHE_DIR_PATH, SNAPSHOT_DIR_PATH]:
+        if not os.path.exists(path):
+            os.makedirs(path)
+
+    LOG_FILE_PATH = Path(logs_dir_path, decouple_config('LOG_FILE', default='steps.log'))
+    PYTHON_VERSION = f'{sys.version_info.major}.{sys.version_info.minor}'
+    JOB_LIST = decouple_config('JOB_LIST', default=[], cast=json.loads)
+    JOB_RERUNS = decouple_config('JOB_RERUNS', default=0, cast=int)
+    JOB_RERUNS_DELAY = decouple_config('JOB_RERUNS_DELAY', default=0, cast=int)
+    BROWSER_LIST = decouple_config('BROWSER_LIST', default='chrome,edge,firefox', cast=lambda x: x.split(','))
+    BROWSER_HEADLESS_MODE = decouple_config('BROWSER_HEADLESS_MODE', default=True, cast=bool)
+    BROWSER_TIMEOUT = decouple_config('BROWSER_TIMEOUT', default=140, cast=int)
+    SLEEP_TIME_UPPER_LIMIT_RANGE = decouple_config('SLEEP_TIME_UPPER_LIMIT_RANGE', default='60,120',
+                                                   cast=lambda x: tuple(int(val) for val in x.split(',')))
+    USERS = decouple_config('USERS', cast=lambda x: json.loads(x))
+
+    ASSET_REPORT_FILE_PATH = Path(import_report_dir_path, decouple_config('ASSET_REPORT'))
+    ASSET_REPORT_SHEET = decouple_config('ASSET_REPORT_SHEET')
+
+    UPSERT_BATCH_SIZE = decouple_config('UPSERT_BATCH_SIZE', default=1000, cast=int)
+    UPSERT_SKIP_UNCHANGED = decouple_config('UPSERT_SKIP_UNCHANGED', default=False, cast=bool)
+    REJECTS_FILE_ENABLED = decouple_config('REJECTS_FILE_ENABLED', default=False, cast=bool)
+    XLSX_READER_ENGINE = decouple_config('XLSX_READER_ENGINE', default='auto')
+    MEM_CSV_CHUNK_SIZE = decouple_config('MEM_CSV_CHUNK_SIZE', default=50000, cast=int)
+    JSON_READER_ENGINE = decouple_config('JSON_READER_ENGINE', default='auto')
+    SYS_MAPPING_BATCH_SIZE = decouple_config('SYS_MAPPING_BATCH_SIZE', default=50000, cast=int)
+    SN_EXPORT_MODE = decouple_config('SN_EXPORT_MODE', default='browser')
+    SN_API_BASE_URL = decouple_config('SN_API_BASE_URL', default='')
+    SN_API_USERNAME = decouple_config('SN_API_USERNAME', default='')
+    SN_API_PASSWORD = decouple_config('SN_API_PASSWORD', default='')
+    SN_API_TABLE = decouple_config('SN_API_TABLE', default='cmdb_ci_computer')
+    SN_API_QUERY = decouple_config('SN_API_QUERY', default='')
+    SN_API_FIELDS = decouple_config('SN_API_FIELDS', default='', cast=lambda x: json.loads(x) if x else None)
+    SN_API_PAGE_SIZE = decouple_config('SN_API_PAGE_SIZE', default=10000, cast=int)
+    SN_API_WORKERS = decouple_config('SN_API_WORKERS', default=4, cast=int)
+    SN_API_TIMEOUT = decouple_config('SN_API_TIMEOUT', default=300, cast=int)
+    SN_API_RETRIES = decouple_config('SN_API_RETRIES', default=3, cast=int)
+    SNAPSHOT_ENABLED = decouple_config('SNAPSHOT_ENABLED', default=False, cast=bool)
+    SNAPSHOT_RETENTION_DAYS = decouple_config('SNAPSHOT_RETENTION_DAYS', default=7, cast=int)
+    BULK_LOAD_TABLES = decouple_config('BULK_LOAD_TABLES', default='', cast=lambda x: x.split(',') if x else [])
+    FETCH_CHUNK_SIZE = decouple_config('FETCH_CHUNK_SIZE', default=10000, cast=int)
+    EXTRACTION_WORKERS = decouple_config('EXTRACTION_WORKERS', default=4, cast=int)
+    EMPLOYEE_CACHE_TTL = decouple_config('EMPLOYEE_CACHE_TTL', default=0, cast=int)
+    EMPLOYEE_CACHE_PROBE = decouple_config('EMPLOYEE_CACHE_PROBE', default=True, cast=bool)
+
+    USAGE_INFO_MATERIALIZED_VIEW = decouple_config('USAGE_INFO_MATERIALIZED_VIEW', default=False, cast=bool)
+    EXCEL_WIDTH_SAMPLE_SIZE = decouple_config('EXCEL_WIDTH_SAMPLE_SIZE', default=10000, cast=int)
+    USAGE_REPORT_CONSTANT_MEMORY = decouple_config('USAGE_REPORT_CONSTANT_MEMORY', default=True, cast=bool)
+    USAGE_REPORT_CHUNK_SIZE = decouple_config('USAGE_REPORT_CHUNK_SIZE', default=0, cast=int)
+    USAGE_REPORT_FILE_NAME = decouple_config('USAGE_REPORT_FILE_NAME', default='usage_report.xlsx')
+    USAGE_REPORT_FILE_PATH = Path(export_report_dir_path, USAGE_REPORT_FILE_NAME)
+
+    CST_NOW = datetime.datetime.now(tz=datetime.timezone(datetime.timedelta(hours=8)))
+    cst_now_str = CST_NOW.strftime('%Y%m%d')
+    TEMP_EMPLOYEE_REPORT_FILE_NAME = decouple_config('TEMP_EMPLOYEE_REPORT_FILE_NAME',
+                                                     default=f'temp_employee_report_{cst_now_str}.xlsx')
+    TEMP_EMPLOYEE_REPORT_FILE_PATH = Path(export_report_dir_path, TEMP_EMPLOYEE_REPORT_FILE_NAME)
+    TEMP_EMPLOYEE_REPORT_FORMAT = decouple_config('TEMP_EMPLOYEE_REPORT_FORMAT', default='xlsx')
+
+    SMTP_SERVER = decouple_config('SMTP_SERVER')
+    SMTP_PORT = decouple_config('SMTP_PORT', cast=int, default=25)
+    TEMP_EMPLOYEE_EMAIL_FROM = decouple_config('TEMP_EMPLOYEE_EMAIL_FROM')
+    TEMP_EMPLOYEE_EMAIL_TO = decouple_config('TEMP_EMPLOYEE_EMAIL_TO', cast=lambda x: x.split(','))
+    TEMP_EMPLOYEE_EMAIL_BCC = decouple_config('TEMP_EMPLOYEE_EMAIL_BCC', cast=lambda x: x.split(','))
+    TEMP_EMPLOYEE_EMAIL_SUBJECT = decouple_config('TEMP_EMPLOYEE_EMAIL_SUBJECT',
+                                                  default=f'{cst_now_str} Temporary Employee Data')
+    TEMP_EMPLOYEE_EMAIL_IT_SUPPORT_MAILBOX = decouple_config('TEMP_EMPLOYEE_EMAIL_IT_SUPPORT_MAILBOX')
+
+
+config = Config()
@@ -0,0 +1,132 @@
+import datetime
+import numbers
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Boolean, DateTime, Integer, Numeric
+
+DataFrameDiff = namedtuple('DataFrameDiff', ['added', 'deleted', 'changed', 'changed_columns'])
+NULL_SENTINEL = '\x00'
+
+
+def get_table_column_types(table_class):
+    return {column.name: column.type for column in table_class.__table__.columns}
+
+
+def canonical_timestamps(values):
+    timestamps = pd.to_datetime(values, utc=True, errors='coerce', format='mixed')
+    canonical = pd.Series(np.char.add(np.datetime_as_string(timestamps.dt.tz_convert(None).to_numpy(), unit='us'),
+                                      '+00:00'), index=values.index, dtype=object)
+    invalid = timestamps.isna()
+    canonical[invalid] = values[invalid].map(str)
+    return canonical
+
+
+def canonical_number(value):
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return str(value)
+    return str(int(number)) if number.is_integer() else repr(number)
+
+
+def canonical_integer(value):
+    if isinstance(value, (int, np.integer)):
+        return str(int(value))
+    if isinstance(value, str):
+        try:
+            return str(int(value.strip()))
+        except ValueError:
+            pass
+    return canonical_number(value)
+
+
+def canonical_boolean(value):
+    if isinstance(value, (bool, np.bool_, int, np.integer)):
+        return 'true' if value else 'false'
+    value = str(value).strip().lower()
+    return {'t': 'true', '1': 'true', 'f': 'false', '0': 'false'}.get(value, value)
+
+
+def canonical_value(value):
+    if type(value) is str:
+        return value
+    if isinstance(value, (bool, np.bool_)):
+        return 'true' if value else 'false'
+    if isinstance(value, (datetime.datetime, np.datetime64)):
+        timestamp = pd.Timestamp(value)
+        timestamp = timestamp.tz_localize('UTC') if timestamp.tzinfo is None else timestamp.tz_convert('UTC')
+        return f"{np.datetime_as_string(timestamp.tz_convert(None).to_datetime64(), unit='us')}+00:00"
+    if isinstance(value, numbers.Number):
+        return canonical_number(value)
+    return str(value)
+
+
+def canonicalize_column(values, column_type=None):
+    not_null = values.notna().to_numpy()
+    canonical = np.full(len(values), NULL_SENTINEL, dtype=object)
+    values = values[not_null]
+    if isinstance(column_type, DateTime):
+        canonical[not_null] = canonical_timestamps(values).to_numpy()
+        return canonical
+    if isinstance(column_type, Boolean):
+        convert = canonical_boolean
+    elif isinstance(column_type, Integer):
+        convert = canonical_integer
+    elif isinstance(column_type, Numeric):
+        convert = canonical_number
+    else:
+        convert = canonical_value
+    canonical[not_null] = [convert(value) for value in values.tolist()]
+    return canonical
+
+
+def is_datetime_column(values):
+    return pd.api.types.is_datetime64_any_dtype(values) or \
+        pd.api.types.infer_dtype(values, skipna=True) in ('datetime', 'datetime64')
+
+
+def infer_shared_column_types(dataframes: list, columns: list):
+    return {column: DateTime() for column in columns
+            if any(is_datetime_column(dataframe[column]) for dataframe in dataframes)}
+
+
+def row_fingerprints(dataframe, columns: list = None, column_types: dict = None):
+    columns = dataframe.columns if columns is None else columns
+    column_types = column_types or {}
+    canonical = pd.DataFrame({column: canonicalize_column(dataframe[column], column_types.get(column))
+                              for column in columns}, index=dataframe.index)
+    return pd.util.hash_pandas_object(canonical, index=False)
+
+
+def is_on_date(values, day):
+    timestamps = pd.to_datetime(values, utc=True)
+    start = pd.Timestamp(day).normalize()
+    return ((timestamps >= start) & (timestamps < start + pd.Timedelta(days=1))).to_numpy()
+
+
+def diff_dataframes(origin, updated, key, columns: list = None, column_types: dict = None):
+    if columns is None:
+        columns = [column for column in updated.columns if column != key and column in origin.columns]
+    column_types = {**infer_shared_column_types([origin, updated], columns), **(column_types or {})}
+    origin_keys = pd.Index(origin[key])
+    updated_keys = pd.Index(updated[key])
+    added = updated_keys[~updated_keys.isin(origin_keys)]
+    deleted = origin_keys[~origin_keys.isin(updated_keys)]
+
+    origin_common = origin.loc[origin_keys.isin(updated_keys), [key] + columns].set_index(key)
+    updated_common = updated.loc[updated_keys.isin(origin_keys), [key] + columns].set_index(key)
+    updated_common = updated_common.reindex(origin_common.index)
+    changed_rows = row_fingerprints(origin_common, columns, column_types).to_numpy() != \
+        row_fingerprints(updated_common, columns, column_types).to_numpy()
+    changed = origin_common.index[changed_rows]
+
+    origin_changed = origin_common[changed_rows]
+    updated_changed = updated_common[changed_rows]
+    changed_columns = pd.DataFrame({
+        column: row_fingerprints(origin_changed, [column], column_types).to_numpy() !=
+        row_fingerprints(updated_changed, [column], column_types).to_numpy()
+        for column in columns
+    }, index=changed)
+    return DataFrameDiff(added, deleted, changed, changed_columns)
@@ -1,51 +1,113 @@
-import pandas as pd
-import wcwidth
-
-
-class ExcelFile(object):
-    def __init__(self, name, path):
-        self.name = name
-        self.path = path
-
-    def __enter__(self):
-        self.writer = pd.ExcelWriter(self.path, engine='xlsxwriter')
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.writer.close()
-
-    def export_dataframe_to_excel(self, dataframe, sheet_name, string_columns: list = None, set_width_by_value=False):
-        workbook = self.writer.book
-        if sheet_name in workbook.sheetnames:
-            sheet = workbook[sheet_name].clear()
-        else:
-            sheet = workbook.add_worksheet(sheet_name)
-        header_format = workbook.add_format({
-            'bold': True,
-            'bg_color': '#5B9BD5',
-            'font_color': '#FFFFFF'
-        })
-        fmt_time = workbook.add_format({'num_format': 'yyyy-mm-dd'})
-        row = 1
-        for i, row_data in dataframe.iterrows():
-            for col_idx, col_value in enumerate(row_data):
-                if pd.isna(col_value):
-                    sheet.write(row, col_idx, None)
-                elif isinstance(col_value, pd.Timestamp):
-                    sheet.write_datetime(row, col_idx, col_value.to_pydatetime(), fmt_time)
-                else:
-                    col_name = dataframe.columns[col_idx]
-                    if string_columns and col_name in string_columns:
-                        sheet.write_string(row, col_idx, str(col_value))
-                    else:
-                        sheet.write(row, col_idx, col_value)
-            row += 1
-        worksheet = self.writer.sheets[sheet_name]
-        if not isinstance(dataframe.columns, pd.RangeIndex):
-            columns_width = [max(len(str(col)), wcwidth.wcswidth(str(col))) + 4 for col in dataframe.columns]
-            for col_idx, col_name in enumerate(dataframe.columns):
-                if set_width_by_value:
-                    max_value_length = dataframe[col_name].astype(str).str.len().max()
-                    columns_width[col_idx] = max(columns_width[col_idx], max_value_length)
-                worksheet.set_column(col_idx, col_idx, columns_width[col_idx])
-                worksheet.write(0, col_idx, col_name, header_format)
+from collections import namedtuple
+
+import pandas as pd
+import wcwidth
+
+from utils.config import config
+
+
+def prepare_column_values(values, as_string=False):
+    not_null = values.notna()
+    if as_string:
+        values = values.astype(str)
+    elif pd.api.types.is_datetime64_any_dtype(values) or pd.api.types.infer_dtype(values, skipna=True) == 'datetime':
+        values = pd.Series(pd.to_datetime(values).dt.to_pydatetime(), index=values.index, dtype=object)
+    return values.astype(object).where(not_null, None).tolist()
+
+
+def measure_column_width(values, sample_size=config.EXCEL_WIDTH_SAMPLE_SIZE):
+    if values.empty:
+        return 0
+    if pd.api.types.infer_dtype(values, skipna=True) == 'string':
+        lengths = values.str.len()
+    else:
+        if len(values) > sample_size:
+            values = values.sample(sample_size, random_state=0)
+        lengths = values.astype(str).str.len()
+    return int(lengths.max()) if lengths.notna().any() else 0
+
+
+SheetData = namedtuple('SheetData', ['header', 'widths', 'columns'])
+
+
+def prepare_sheet_data(dataframe, string_columns: list = None, set_width_by_value=False):
+    header = None
+    widths = None
+    if not isinstance(dataframe.columns, pd.RangeIndex):
+        header = [str(col_name) for col_name in dataframe.columns]
+        widths = [max(len(col_name), wcwidth.wcswidth(col_name)) + 4 for col_name in header]
+        if set_width_by_value:
+            widths = [max(width, measure_column_width(dataframe.iloc[:, col_idx]))
+                      for col_idx, width in enumerate(widths)]
+    columns = [
+        prepare_column_values(dataframe.iloc[:, col_idx], string_columns is not None and col_name in string_columns)
+        for col_idx, col_name in enumerate(dataframe.columns)
+    ]
+    return SheetData(header, widths, columns)
+
+
+class ExcelFile(object):
+    def __init__(self, name, path, constant_memory=False):
+        self.name = name
+        self.path = path
+        self.constant_memory = constant_memory
+        self.header_format = None
+
+    def __enter__(self):
+        options = {'default_date_format': 'yyyy-mm-dd', 'constant_memory': self.constant_memory}
+        self.writer = pd.ExcelWriter(self.path, engine='xlsxwriter', engine_kwargs={'options': options})
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.writer.close()
+
+    def _get_header_format(self):
+        if self.header_format is None:
+            self.header_format = self.writer.book.add_format({
+                'bold': True,
+                'bg_color': '#5B9BD5',
+                'font_color': '#FFFFFF'
+            })
+        return self.header_format
+
+    def _get_worksheet(self, sheet_name):
+        workbook = self.writer.book
+        if sheet_name in workbook.sheetnames:
+            return workbook[sheet_name].clear()
+        return workbook.add_worksheet(sheet_name)
+
+    def _write_header(self, sheet, header):
+        for col_idx, col_name in enumerate(header):
+            sheet.write(0, col_idx, col_name, self._get_header_format())
+
+    @staticmethod
+    def _set_widths(sheet, widths):
+        for col_idx, width in enumerate(widths):
+            sheet.set_column(col_idx, col_idx, width)
+
+    def export_dataframe_chunks_to_excel(self, chunks, sheet_name, string_columns: list = None,
+                                         set_width_by_value=False):
+        sheet = self._get_worksheet(sheet_name)
+        widths = None
+        row = 1
+        for chunk in chunks:
+            sheet_data = prepare_sheet_data(chunk, string_columns, set_width_by_value)
+            if sheet_data.header is not None:
+                if widths is None:
+                    self._write_header(sheet, sheet_data.header)
+                    widths = sheet_data.widths
+                else:
+                    widths = [max(width, chunk_width) for width, chunk_width in zip(widths, sheet_data.widths)]
+            for row_values in zip(*sheet_data.columns):
+                sheet.write_row(row, 0, row_values)
+                row += 1
+        if widths is not None:
+            self._set_widths(sheet, widths)
+        return row - 1
+
+    def export_dataframe_to_excel(self, dataframe, sheet_name, string_columns: list = None, set_width_by_value=False):
+        self.export_dataframe_chunks_to_excel([dataframe], sheet_name, string_columns, set_width_by_value)
+
+    def export_dataframes_to_excel(self, sheets: dict, string_columns: list = None, set_width_by_value=False):
+        for sheet_name, dataframe in sheets.items():
+            self.export_dataframe_to_excel(dataframe, sheet_name, string_columns, set_width_by_value)
@@ -0,0 +1,62 @@
+import json
+
+from utils.config import config
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def iter_json_column_batches_streaming(file, fields: list, batch_size=None, items_prefix='records.item'):
+    columns = {field: [] for field in fields}
+    rows = 0
+    with open(file, 'rb') as json_file:
+        for record in ijson.items(json_file, items_prefix, use_float=True):
+            for field in fields:
+                columns[field].append(record.get(field))
+            rows += 1
+            if rows == batch_size:
+                yield columns
+                columns = {field: [] for field in fields}
+                rows = 0
+    if rows:
+        yield columns
+
+
+def iter_json_column_batches_in_memory(file, fields: list, batch_size=None, items_prefix='records.item'):
+    with open(file, 'rb') as json_file:
+        data = orjson.loads(json_file.read()) if orjson is not None else json.load(json_file)
+    records = data
+    for key in items_prefix.split('.')[:-1]:
+        records = records[key]
+    del data
+    batch_size = batch_size or max(len(records), 1)
+    for start in range(0, len(records), batch_size):
+        yield {field: [record.get(field) for record in records[start:start + batch_size]] for field in fields}
+
+
+def iter_json_column_batches(file, fields: list, batch_size=None, items_prefix='records.item',
+                             engine=config.JSON_READER_ENGINE):
+    if engine == 'auto':
+        engine = 'ijson' if ijson is not None else 'memory'
+    if engine == 'ijson':
+        if ijson is None:
+            raise ImportError("JSON_READER_ENGINE is 'ijson' but ijson is not installed")
+        return iter_json_column_batches_streaming(file, fields, batch_size, items_prefix)
+    if engine == 'memory':
+        return iter_json_column_batches_in_memory(file, fields, batch_size, items_prefix)
+    raise ValueError(f"Unknown json reader engine '{engine}'")
+
+
+def read_json_columns(file, fields: list, items_prefix='records.item', engine=config.JSON_READER_ENGINE):
+    columns = {field: [] for field in fields}
+    for batch in iter_json_column_batches(file, fields, None, items_prefix, engine):
+        for field in fields:
+            columns[field].extend(batch[field])
+    return columns
@@ -0,0 +1,30 @@
+import io
+import zipfile
+
+
+class ReportBundle(object):
+    def __init__(self, name, path, file_format='csv'):
+        self.name = name
+        self.path = path
+        self.file_format = file_format
+
+    def __enter__(self):
+        self.bundle = zipfile.ZipFile(self.path, 'w', compression=zipfile.ZIP_DEFLATED)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.bundle.close()
+
+    def export_dataframe(self, dataframe, sheet_name):
+        if self.file_format == 'parquet':
+            buffer = io.BytesIO()
+            dataframe.to_parquet(buffer, index=False)
+            self.bundle.writestr(f'{sheet_name}.parquet', buffer.getvalue())
+        elif self.file_format == 'csv':
+            self.bundle.writestr(f'{sheet_name}.csv', dataframe.to_csv(index=False).encode('utf-8-sig'))
+        else:
+            raise ValueError(f'Unsupported report bundle format: {self.file_format}')
+
+    def export_dataframes(self, sheets: dict):
+        for sheet_name, dataframe in sheets.items():
+            self.export_dataframe(dataframe, sheet_name)
@@ -0,0 +1,147 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+import xlsxwriter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from databases.asset_database import COMPUTER_COLUMN_MAPPING
+from utils.config import config
+from utils.users import User
+from utils.utils import get_base_url_by_job_name
+from utils.xlsx_reader import deduplicate_header
+
+SN_JOB_NAME = 'test_download_sn_report'
+SN_EXPORT_FILE_NAME = 'cmdb_ci_computer'
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+
+def get_api_auth():
+    if config.SN_API_USERNAME:
+        return config.SN_API_USERNAME, config.SN_API_PASSWORD
+    user = User().get_user('sn')
+    return user['email'], user['password']
+
+
+class ServiceNowTableClient(object):
+    def __init__(self, base_url, auth, page_size=config.SN_API_PAGE_SIZE, workers=config.SN_API_WORKERS,
+                 timeout=config.SN_API_TIMEOUT, retries=config.SN_API_RETRIES):
+        self.base_url = base_url.rstrip('/')
+        self.page_size = page_size
+        self.workers = max(workers, 1)
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.auth = auth
+        self.session.headers.update({'Accept': 'application/json'})
+        retry = Retry(total=retries, backoff_factor=1, status_forcelist=RETRY_STATUS_CODES, allowed_methods=['GET'])
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.session.close()
+
+    def get_page(self, table_name, fields: list, query='', offset=0):
+        params = {
+            'sysparm_fields': ','.join(fields),
+            'sysparm_query': f'{query}^ORDERBYsys_id' if query else 'ORDERBYsys_id',
+            'sysparm_display_value': 'true',
+            'sysparm_exclude_reference_link': 'true',
+            'sysparm_offset': offset,
+            'sysparm_limit': self.page_size,
+        }
+        response = self.session.get(f'{self.base_url}/api/now/table/{table_name}', params=params,
+                                    timeout=self.timeout)
+        response.raise_for_status()
+        total_count = response.headers.get('X-Total-Count')
+        return response.json()['result'], int(total_count) if total_count is not None else None
+
+    def get_records(self, table_name, fields: list, query=''):
+        records, total_count = self.get_page(table_name, fields, query)
+        if total_count is None:
+            offset = len(records)
+            page = records
+            while len(page) == self.page_size:
+                page, _ = self.get_page(table_name, fields, query, offset)
+                records.extend(page)
+                offset += len(page)
+            return records
+        offsets = range(self.page_size, total_count, self.page_size)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for page in executor.map(lambda offset: self.get_page(table_name, fields, query, offset)[0], offsets):
+                records.extend(page)
+        return records
+
+
+def write_records_to_excel(records, fields: list, file):
+    workbook = xlsxwriter.Workbook(str(file), {'constant_memory': True})
+    try:
+        sheet = workbook.add_worksheet('Page 1')
+        sheet.write_row(0, 0, [label for _, label in fields])
+        for row, record in enumerate(records, start=1):
+            for col, (field, _) in enumerate(fields):
+                value = record.get(field)
+                if value is not None and value != '':
+                    sheet.write_string(row, col, str(value))
+    finally:
+        workbook.close()
+
+
+def write_records_to_json(records, file):
+    with open(file, 'w', encoding='utf-8') as json_file:
+        json.dump({'records': records}, json_file, ensure_ascii=False)
+
+
+def replace_file(write, file, *args):
+    temp_file = Path(file).with_name(f'{Path(file).name}.tmp')
+    try:
+        write(*args, temp_file)
+        os.replace(temp_file, file)
+    finally:
+        Path(temp_file).unlink(missing_ok=True)
+
+
+def check_field_labels(fields: list):
+    labels = deduplicate_header([label for _, label in fields])
+    missing_labels = [label for label in COMPUTER_COLUMN_MAPPING if label not in labels]
+    if missing_labels:
+        raise ValueError(f'SN_API_FIELDS has no field for the importer columns {missing_labels}')
+
+
+def check_returned_fields(records, api_fields: list):
+    returned_fields = set().union(*(record.keys() for record in records))
+    missing_fields = [field for field in api_fields if field not in returned_fields]
+    if records and missing_fields:
+        raise ValueError(f'The Table API returned no values for {missing_fields}, check the field names in '
+                         f'SN_API_FIELDS')
+
+
+def export_sn_report(client, fields: list, directory=config.BROWSER_DOWNLOAD_DIR_PATH,
+                     table_name=config.SN_API_TABLE, query=config.SN_API_QUERY):
+    check_field_labels(fields)
+    api_fields = list(dict.fromkeys(['sys_id'] + [field for field, _ in fields]))
+    start = time.perf_counter()
+    records = client.get_records(table_name, api_fields, query)
+    check_returned_fields(records, api_fields)
+    print(f"Fetched {len(records)} '{table_name}' records from the Table API in {time.perf_counter() - start:.1f}s")
+    excel_file = Path(directory, f'{SN_EXPORT_FILE_NAME}.xlsx')
+    json_file = Path(directory, f'{SN_EXPORT_FILE_NAME}.json')
+    replace_file(write_records_to_excel, excel_file, records, fields)
+    replace_file(write_records_to_json, json_file, records)
+    return excel_file, json_file
+
+
+def export_sn_report_via_api():
+    if not config.SN_API_FIELDS:
+        raise ValueError("SN_EXPORT_MODE is 'api' but SN_API_FIELDS is not set, set it to the [field, label] pairs "
+                         "of the cmdb_ci_computer report")
+    base_url = config.SN_API_BASE_URL or get_base_url_by_job_name(config.JOB_LIST, SN_JOB_NAME)
+    with ServiceNowTableClient(base_url, get_api_auth()) as client:
+        return export_sn_report(client, config.SN_API_FIELDS)
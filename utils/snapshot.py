@@ -0,0 +1,177 @@
+import datetime
+import json
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
+
+from utils.config import config
+from utils.diff import diff_dataframes
+
+MANIFEST_FILE_NAME = 'manifest.json'
+DAY_FORMAT = '%Y%m%d'
+
+
+def to_arrow_compatible(values):
+    inferred_type = pd.api.types.infer_dtype(values, skipna=True)
+    if inferred_type in ('string', 'empty', 'integer', 'floating', 'boolean', 'date', 'decimal'):
+        return values
+    if inferred_type in ('datetime', 'datetime64'):
+        try:
+            return pd.to_datetime(values)
+        except (ValueError, TypeError):
+            pass
+    if inferred_type == 'mixed-integer-float':
+        return pd.to_numeric(values)
+    return values.astype(str).where(values.notna(), None)
+
+
+def prepare_for_arrow(dataframe):
+    dataframe = dataframe.reset_index(drop=True)
+    for column_name in dataframe.select_dtypes(include='object').columns:
+        dataframe[column_name] = to_arrow_compatible(dataframe[column_name])
+    return dataframe
+
+
+def get_snapshot_path(table_name, day=config.CST_NOW):
+    return Path(config.SNAPSHOT_DIR_PATH, table_name, day.strftime(DAY_FORMAT))
+
+
+def is_snapshot_day(name):
+    try:
+        return datetime.datetime.strptime(name, DAY_FORMAT).strftime(DAY_FORMAT) == name
+    except ValueError:
+        return False
+
+
+def list_snapshot_days(table_name):
+    table_path = Path(config.SNAPSHOT_DIR_PATH, table_name)
+    if not table_path.exists():
+        return []
+    return sorted(path.name for path in table_path.iterdir()
+                  if is_snapshot_day(path.name) and Path(path, MANIFEST_FILE_NAME).exists())
+
+
+def read_manifest(snapshot_path):
+    with open(Path(snapshot_path, MANIFEST_FILE_NAME), 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+class SnapshotWriter(object):
+    def __init__(self, table_name, source=None, day=config.CST_NOW):
+        self.table_name = table_name
+        self.source = source
+        self.path = get_snapshot_path(table_name, day)
+        self.temp_path = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+        self.parts = []
+        self.columns = None
+
+    def __enter__(self):
+        shutil.rmtree(self.temp_path, ignore_errors=True)
+        os.makedirs(self.temp_path)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            shutil.rmtree(self.temp_path, ignore_errors=True)
+            return
+        self._write_manifest()
+        shutil.rmtree(self.path, ignore_errors=True)
+        os.replace(self.temp_path, self.path)
+        print(f"Saved snapshot of '{self.table_name}' with {sum(part['rows'] for part in self.parts)} rows "
+              f"to {self.path}")
+        self._remove_expired_snapshots()
+
+    def write(self, dataframe):
+        dataframe = prepare_for_arrow(dataframe)
+        if self.columns is None:
+            self.columns = {column_name: str(dtype) for column_name, dtype in dataframe.dtypes.items()}
+        file_name = f'part-{len(self.parts):05d}.arrow'
+        feather.write_feather(dataframe, Path(self.temp_path, file_name), compression='uncompressed')
+        self.parts.append({'file': file_name, 'rows': len(dataframe)})
+
+    def _write_manifest(self):
+        manifest = {
+            'table': self.table_name,
+            'source': str(self.source) if self.source is not None else None,
+            'created': datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+            'rows': sum(part['rows'] for part in self.parts),
+            'columns': self.columns or {},
+            'parts': self.parts,
+        }
+        with open(Path(self.temp_path, MANIFEST_FILE_NAME), 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, ensure_ascii=False, indent=2)
+
+    def _remove_expired_snapshots(self):
+        if config.SNAPSHOT_RETENTION_DAYS <= 0:
+            return
+        days = list_snapshot_days(self.table_name)
+        for day in days[:-config.SNAPSHOT_RETENTION_DAYS]:
+            shutil.rmtree(Path(config.SNAPSHOT_DIR_PATH, self.table_name, day), ignore_errors=True)
+
+
+@contextmanager
+def open_snapshot(table_name, source=None, day=config.CST_NOW):
+    if not config.SNAPSHOT_ENABLED:
+        yield None
+        return
+    with SnapshotWriter(table_name, source, day) as snapshot:
+        yield snapshot
+
+
+def get_common_type(types: list):
+    types = list(dict.fromkeys(data_type for data_type in types if not pa.types.is_null(data_type)))
+    if not types:
+        return pa.null()
+    if len(types) == 1:
+        return types[0]
+    if all(pa.types.is_integer(data_type) for data_type in types):
+        return pa.int64()
+    if all(pa.types.is_integer(data_type) or pa.types.is_floating(data_type) for data_type in types):
+        return pa.float64()
+    if all(pa.types.is_timestamp(data_type) for data_type in types):
+        return pa.timestamp('ns', tz='UTC' if any(data_type.tz for data_type in types) else None)
+    return pa.string()
+
+
+def cast_to_common_schema(tables: list):
+    names = list(dict.fromkeys(name for table in tables for name in table.column_names))
+    schema = pa.schema([(name, get_common_type([table.schema.field(name).type for table in tables
+                                                  if name in table.column_names])) for name in names])
+    return [pa.table([table[name].cast(field.type) if name in table.column_names
+                      else pa.nulls(len(table), field.type) for name, field in zip(names, schema)], schema=schema)
+            for table in tables]
+
+
+def load_snapshot(table_name, day: str = None):
+    days = list_snapshot_days(table_name)
+    if day is None:
+        if not days:
+            return None
+        day = days[-1]
+    elif day not in days:
+        return None
+    snapshot_path = Path(config.SNAPSHOT_DIR_PATH, table_name, day)
+    manifest = read_manifest(snapshot_path)
+    tables = [feather.read_table(Path(snapshot_path, part['file']), memory_map=True) for part in manifest['parts']]
+    if not tables:
+        return pd.DataFrame(columns=list(manifest['columns']))
+    return pa.concat_tables(cast_to_common_schema(tables)).to_pandas()
+
+
+def diff_snapshots(table_name, key, day: str = None, previous_day: str = None, columns: list = None,
+                   column_types: dict = None):
+    days = list_snapshot_days(table_name)
+    day = day or (days[-1] if days else None)
+    if previous_day is None:
+        earlier_days = [snapshot_day for snapshot_day in days if day is not None and snapshot_day < day]
+        previous_day = earlier_days[-1] if earlier_days else None
+    current = load_snapshot(table_name, day) if day else None
+    previous = load_snapshot(table_name, previous_day) if previous_day else None
+    if current is None or previous is None:
+        return None
+    return diff_dataframes(previous, current, key, columns, column_types)
@@ -0,0 +1,22 @@
+import pandas as pd
+
+SHANGHAI_TIMEZONE = 'Asia/Shanghai'
+
+
+def normalize_timestamps(values, source_timezone='UTC', target_timezone=SHANGHAI_TIMEZONE, format='ISO8601'):
+    timestamps = pd.to_datetime(values, format=format, errors='coerce')
+    if timestamps.dt.tz is None:
+        timestamps = timestamps.dt.tz_localize(source_timezone)
+    has_value = values.notna() & (values.astype(str).str.strip() != '')
+    coerced = int((has_value & timestamps.isna()).sum())
+    return timestamps.dt.tz_convert(target_timezone), coerced
+
+
+def normalize_timestamp_columns(dataframe, columns: list, source_timezone='UTC', target_timezone=SHANGHAI_TIMEZONE,
+                                format='ISO8601'):
+    for column_name in columns:
+        dataframe[column_name], coerced = normalize_timestamps(dataframe[column_name], source_timezone,
+                                                               target_timezone, format)
+        if coerced:
+            print(f"Coerced {coerced} unparseable or out of range values in '{column_name}' to null")
+    return dataframe
@@ -1,14 +1,24 @@
-import inspect
-
-
-def get_current_function_name():
-    stack = inspect.stack()
-    caller_frame = stack[1]
-    return caller_frame.frame.f_code.co_name
-
-
-def get_base_url_by_job_name(json_data, job_name):
-    for item in json_data:
-        if item['job_name'] == job_name:
-            return item['base_url']
-    return None
+import inspect
+from pathlib import Path
+
+from utils.config import config
+
+
+def get_current_function_name():
+    stack = inspect.stack()
+    caller_frame = stack[1]
+    return caller_frame.frame.f_code.co_name
+
+
+def get_base_url_by_job_name(json_data, job_name):
+    for item in json_data:
+        if item['job_name'] == job_name:
+            return item['base_url']
+    return None
+
+
+def get_rejects_file_path(file_path):
+    if not config.REJECTS_FILE_ENABLED:
+        return None
+    file_path = Path(file_path)
+    return file_path.with_name(f'{file_path.stem}_rejects.csv')
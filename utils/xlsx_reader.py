@@ -0,0 +1,153 @@
+from collections import Counter
+
+import numpy as np
+import openpyxl
+import pandas as pd
+from sqlalchemy import Boolean, DateTime, Float, Integer
+
+from utils.config import config
+
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
+
+HIDDEN_SHEET_STATES = ['hidden', 'veryHidden']
+
+
+def get_single_visible_sheet(sheet_names, file):
+    if len(sheet_names) != 1:
+        raise Exception(f'{file}: the excel file should contain only one visible sheet')
+    return sheet_names[0]
+
+
+def deduplicate_header(header):
+    seen = Counter()
+    columns = []
+    for col_idx, col_name in enumerate(header):
+        col_name = f'Unnamed: {col_idx}' if col_name is None or col_name == '' else str(col_name)
+        columns.append(col_name if not seen[col_name] else f'{col_name}.{seen[col_name]}')
+        seen[col_name] += 1
+    return columns
+
+
+class ColumnBuffers(object):
+    def __init__(self, width, capacity):
+        self.width = width
+        self.buffers = [np.empty(max(capacity, 1), dtype=object) for _ in range(width)]
+        self.rows = 0
+        self.last_non_empty_row = 0
+
+    def append(self, row):
+        if self.rows == len(self.buffers[0]):
+            self.buffers = [np.resize(buffer, len(buffer) * 2) for buffer in self.buffers]
+        is_empty = True
+        for col_idx in range(self.width):
+            value = row[col_idx] if col_idx < len(row) else None
+            if isinstance(value, str) and value == '':
+                value = None
+            self.buffers[col_idx][self.rows] = value
+            is_empty = is_empty and value is None
+        self.rows += 1
+        if not is_empty:
+            self.last_non_empty_row = self.rows
+
+    def to_columns(self):
+        return [buffer[:self.last_non_empty_row] for buffer in self.buffers]
+
+
+def to_text(value):
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, float):
+        if value != value:
+            return None
+        if value.is_integer():
+            return str(int(value))
+    return str(value)
+
+
+def convert_column(values, column_type=None):
+    values = pd.Series(values, dtype=object)
+    if isinstance(column_type, Boolean):
+        return (values.astype('boolean') if values.dropna().map(type).eq(bool).all() else values), 0
+    if isinstance(column_type, Integer):
+        numbers = pd.to_numeric(values, errors='coerce')
+        converted = numbers.where(numbers % 1 == 0).astype('Int64')
+    elif isinstance(column_type, Float):
+        converted = pd.to_numeric(values, errors='coerce')
+    elif isinstance(column_type, DateTime):
+        converted = pd.to_datetime(values, errors='coerce', format='mixed')
+    elif column_type is not None:
+        return values.map(to_text), 0
+    else:
+        return values, 0
+    return converted, int((values.notna() & converted.isna()).sum())
+
+
+def build_dataframe(header, buffers, column_types: dict = None):
+    column_types = column_types or {}
+    columns = {}
+    for col_name, values in zip(deduplicate_header(header), buffers.to_columns()):
+        columns[col_name], coerced = convert_column(values, column_types.get(col_name))
+        if coerced:
+            print(f"Coerced {coerced} invalid values in '{col_name}' to null")
+    return pd.DataFrame(columns)
+
+
+def read_xlsx_openpyxl(file, column_types: dict = None, sheet_name=None):
+    workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    try:
+        if sheet_name is None:
+            sheet_name = get_single_visible_sheet(
+                [sheet.title for sheet in workbook.worksheets if sheet.sheet_state not in HIDDEN_SHEET_STATES], file)
+        sheet = workbook[sheet_name]
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, ())
+        buffers = ColumnBuffers(len(header), (sheet.max_row or 1) - 1)
+        for row in rows:
+            buffers.append(row)
+    finally:
+        workbook.close()
+    return build_dataframe(header, buffers, column_types)
+
+
+def read_xlsx_calamine(file, column_types: dict = None, sheet_name=None):
+    workbook = python_calamine.CalamineWorkbook.from_path(str(file))
+    try:
+        if sheet_name is None:
+            sheet_name = get_single_visible_sheet(
+                [sheet.name for sheet in workbook.sheets_metadata
+                 if sheet.visible == python_calamine.SheetVisibleEnum.Visible], file)
+        sheet = workbook.get_sheet_by_name(sheet_name)
+        rows = sheet.iter_rows()
+        header = next(rows, [])
+        buffers = ColumnBuffers(len(header), sheet.height - 1)
+        for row in rows:
+            buffers.append(row)
+    finally:
+        workbook.close()
+    return build_dataframe(header, buffers, column_types)
+
+
+def read_xlsx_pandas(file, sheet_name=None):
+    with pd.ExcelFile(file, engine='openpyxl') as excel_file:
+        if sheet_name is None:
+            sheet_name = get_single_visible_sheet(
+                [sheet.title for sheet in excel_file.book.worksheets if sheet.sheet_state not in HIDDEN_SHEET_STATES],
+                file)
+        return pd.read_excel(excel_file, sheet_name=sheet_name)
+
+
+def read_xlsx(file, column_types: dict = None, sheet_name=None, engine=config.XLSX_READER_ENGINE):
+    if engine == 'pandas':
+        return read_xlsx_pandas(file, sheet_name)
+    if engine == 'auto':
+        engine = 'calamine' if python_calamine is not None else 'openpyxl'
+    if engine == 'calamine':
+        if python_calamine is None:
+            raise ImportError("XLSX_READER_ENGINE is 'calamine' but python-calamine is not installed")
+        return read_xlsx_calamine(file, column_types, sheet_name)
+    if engine == 'openpyxl':
+        return read_xlsx_openpyxl(file, column_types, sheet_name)
+    raise ValueError(f"Unknown xlsx reader engine '{engine}'")